@@ -0,0 +1,108 @@
+/**
+ * Build the Agentation JavaScript assets.
+ *
+ * Produces:
+ *   src/agentation/static/bootstrap.min.js   - small IIFE injected into every page
+ *   src/agentation/static/chunks/*.js        - ES module chunks loaded on demand
+ *   src/agentation/static/chunks/manifest.json
+ *
+ * Stylesheets in src/js/*.css are imported as text and injected in <style>
+ * elements; the manifest lists their CSP hashes.
+ *
+ * Usage: node scripts/build.mjs [--dev] [--watch]
+ */
+
+import { createHash } from 'node:crypto';
+import { mkdirSync, readdirSync, readFileSync, rmSync, writeFileSync } from 'node:fs';
+import { basename, join } from 'node:path';
+import * as esbuild from 'esbuild';
+
+const SOURCE_DIR = 'src/js';
+const STATIC_DIR = 'src/agentation/static';
+const CHUNKS_DIR = join(STATIC_DIR, 'chunks');
+
+const dev = process.argv.includes('--dev');
+const watch = process.argv.includes('--watch');
+
+/**
+ * CSP hash sources of the stylesheets, as injected by the toolbar.
+ */
+function styleHashes() {
+  return readdirSync(SOURCE_DIR)
+    .filter((name) => name.endsWith('.css'))
+    .sort()
+    .map((name) => {
+      const digest = createHash('sha384').update(readFileSync(join(SOURCE_DIR, name)));
+      return `sha384-${digest.digest('base64')}`;
+    });
+}
+
+/**
+ * Write the chunk manifest read by agentation.assets.
+ * Maps entry names to their hashed file names, lists every servable file and
+ * the hashes of the injected stylesheets.
+ */
+const manifestPlugin = {
+  name: 'agentation-manifest',
+  setup(build) {
+    // Dynamically imported modules are reported as entry points too; only list ours
+    const entryPoints = new Set(build.initialOptions.entryPoints);
+
+    build.onEnd((result) => {
+      if (!result.metafile) return;
+
+      const entries = {};
+      const files = [];
+      for (const [path, output] of Object.entries(result.metafile.outputs)) {
+        if (!path.endsWith('.js')) continue;
+        files.push(basename(path));
+        if (entryPoints.has(output.entryPoint)) {
+          entries[basename(output.entryPoint, '.js')] = basename(path);
+        }
+      }
+      files.sort();
+
+      writeFileSync(
+        join(CHUNKS_DIR, 'manifest.json'),
+        JSON.stringify({ entries, files, styles: styleHashes() }, null, 2) + '\n',
+      );
+    });
+  },
+};
+
+const bootstrapOptions = {
+  entryPoints: ['src/js/bootstrap.js'],
+  bundle: true,
+  minify: !dev,
+  format: 'iife',
+  loader: { '.css': 'text' },
+  outfile: join(STATIC_DIR, 'bootstrap.min.js'),
+};
+
+const chunkOptions = {
+  entryPoints: ['src/js/toolbar.js'],
+  bundle: true,
+  minify: !dev,
+  splitting: true,
+  format: 'esm',
+  loader: { '.css': 'text' },
+  outdir: CHUNKS_DIR,
+  entryNames: '[name]-[hash]',
+  chunkNames: '[name]-[hash]',
+  metafile: true,
+  plugins: [manifestPlugin],
+};
+
+// Hashed names change on every content change, so start from an empty directory
+rmSync(CHUNKS_DIR, { recursive: true, force: true });
+mkdirSync(CHUNKS_DIR, { recursive: true });
+
+if (watch) {
+  const contexts = await Promise.all([
+    esbuild.context(bootstrapOptions),
+    esbuild.context(chunkOptions),
+  ]);
+  await Promise.all(contexts.map((ctx) => ctx.watch()));
+} else {
+  await Promise.all([esbuild.build(bootstrapOptions), esbuild.build(chunkOptions)]);
+}
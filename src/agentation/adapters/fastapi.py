@@ -2,15 +2,122 @@
 
 from __future__ import annotations
 
-from typing import Any
+import os
+from typing import Any, cast
 
+import anyio
+from starlette.datastructures import Headers
 from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
 from starlette.requests import Request
 from starlette.responses import Response
-from starlette.types import ASGIApp
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+from agentation.assets import (
+    ASSET_PREFIX,
+    IMMUTABLE_CACHE_CONTROL,
+    get_asset_content,
+    get_preload_link,
+)
 from agentation.config import AgentationConfig, is_enabled
-from agentation.injector import inject_agentation
+from agentation.csp import CSP_HEADERS, amend_policy, get_csp_sources, get_csp_style_sources
+from agentation.injector import (
+    find_body_close_in_file,
+    get_injection,
+    inject_agentation,
+    loads_bundle_by_url,
+)
+
+# ASGI extension for sending 103 Early Hints before the final response
+EARLY_HINT_EXTENSION = "http.response.early_hint"
+
+# ASGI extension for responses that are a whole file, sent by the server
+PATHSEND_EXTENSION = "http.response.pathsend"
+
+# ASGI extension for sending a file range with os.sendfile
+ZEROCOPY_EXTENSION = "http.response.zerocopysend"
+
+# Read size for file ranges when the server cannot send them itself
+FILE_CHUNK_SIZE = 64 * 1024
+
+
+def _root_path(scope: Scope) -> str:
+    """Path the app is mounted at, by a Mount or behind a proxy; prefixes asset URLs."""
+    root_path: str = scope.get("root_path", "")
+    return root_path
+
+
+def _route_path(scope: Scope) -> str:
+    """Path of the request within the app, i.e. without the root path."""
+    path: str = scope["path"]
+    root_path = _root_path(scope)
+    if root_path and path.startswith(root_path):
+        return path[len(root_path) :]
+    return path
+
+
+async def _send_file_range(
+    send: Send,
+    file: anyio.AsyncFile[bytes],
+    offset: int,
+    count: int,
+    zerocopy: bool,
+    more_body: bool,
+) -> None:
+    """Send ``count`` bytes of ``file`` from ``offset``, via the server if it can."""
+    if zerocopy and count:
+        await send(
+            {
+                "type": ZEROCOPY_EXTENSION,
+                "file": file.wrapped,
+                "offset": offset,
+                "count": count,
+                "more_body": more_body,
+            }
+        )
+        return
+
+    await file.seek(offset)
+    while count > 0:
+        chunk = await file.read(min(FILE_CHUNK_SIZE, count))
+        if not chunk:
+            break
+        count -= len(chunk)
+        await send({"type": "http.response.body", "body": chunk, "more_body": True})
+    if not more_body:
+        await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+
+class _FileSpliceResponse(Response):
+    """Sends a file with ``payload`` inserted at ``offset``, without reading it into memory."""
+
+    def __init__(
+        self,
+        path: str,
+        size: int,
+        offset: int,
+        payload: bytes,
+        status_code: int,
+        raw_headers: list[tuple[bytes, bytes]],
+    ) -> None:
+        # The body is sent from the file, so the base response holds no content
+        super().__init__(status_code=status_code)
+        self.raw_headers = raw_headers
+        self.path = path
+        self.size = size
+        self.offset = offset
+        self.payload = payload
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        zerocopy = ZEROCOPY_EXTENSION in scope.get("extensions", {})
+        await send(
+            {"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers}
+        )
+        async with await anyio.open_file(self.path, "rb") as file:
+            await _send_file_range(send, file, 0, self.offset, zerocopy, more_body=True)
+            await send({"type": "http.response.body", "body": self.payload, "more_body": True})
+            await _send_file_range(
+                send, file, self.offset, self.size - self.offset, zerocopy, more_body=False
+            )
 
 
 class AgentationMiddleware(BaseHTTPMiddleware):
@@ -21,17 +128,57 @@ class AgentationMiddleware(BaseHTTPMiddleware):
         self.config = config or AgentationConfig()
         self._enabled: bool | None = None
 
-    async def dispatch(
-        self, request: Request, call_next: RequestResponseEndpoint
-    ) -> Response:
+    def _is_enabled(self, app: Any) -> bool:
         # Lazy enable check (need app.debug which may not be set at init time)
         if self._enabled is None:
-            debug: bool = getattr(request.app, "debug", False)
+            debug: bool = getattr(app, "debug", False)
             self._enabled = is_enabled(self.config, framework_debug=debug)
+        return self._enabled
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] == "http"
+            and self._is_enabled(scope.get("app"))
+            and self._wants_early_hint(scope)
+        ):
+            # Sent before the handler runs, so the bootstrap download overlaps server work
+            await send(
+                {
+                    "type": EARLY_HINT_EXTENSION,
+                    "links": [get_preload_link(_root_path(scope)).encode("latin-1")],
+                }
+            )
+
+        await super().__call__(scope, receive, send)
 
-        if not self._enabled:
+    def _wants_early_hint(self, scope: Scope) -> bool:
+        if not self.config.preload or EARLY_HINT_EXTENSION not in scope.get("extensions", {}):
+            return False
+        if self.config.csp:
+            # Whether the bootstrap is loaded by URL depends on the request's nonce,
+            # which is only known once the handler has run
+            return False
+        if scope["method"] != "GET":
+            return False
+        # Only page navigations will go on to load the toolbar
+        return "text/html" in Headers(scope=scope).get("accept", "")
+
+    async def dispatch(
+        self, request: Request, call_next: RequestResponseEndpoint
+    ) -> Response:
+        if not self._is_enabled(request.app):
             return await call_next(request)
 
+        route_path = _route_path(request.scope)
+        if route_path.startswith(ASSET_PREFIX):
+            asset = get_asset_content(route_path)
+            if asset is not None:
+                return Response(
+                    content=asset,
+                    media_type="text/javascript",
+                    headers={"Cache-Control": IMMUTABLE_CACHE_CONTROL},
+                )
+
         response = await call_next(request)
 
         content_type: str = response.headers.get("content-type", "")
@@ -43,17 +190,115 @@ class AgentationMiddleware(BaseHTTPMiddleware):
         if body_iterator is None:
             return response
 
-        body = b""
+        chunks: list[bytes] = []
         async for chunk in body_iterator:
-            body += chunk
+            if isinstance(chunk, dict):
+                # A pathsend message, only sent when the server advertises
+                # PATHSEND_EXTENSION: the response is a file on disk
+                message = cast(Message, chunk)
+                path: str = message["path"]
+                return await self._inject_file(request, response, path)
+            chunks.append(chunk)
+
+        html = b"".join(chunks).decode("utf-8")
+        if request.method == "HEAD" and not html:
+            # Header-only response (e.g. FileResponse): the length of the injected body
+            # a GET would get is unknown, and the handler's would be wrong, so omit it
+            head = Response(status_code=response.status_code)
+            head.raw_headers = self._injected_headers(request, response, None, injected=False)
+            return head
 
-        html = body.decode("utf-8")
         route = request.url.path
-        html = inject_agentation(html, self.config, route=route)
+        new_html = inject_agentation(
+            html,
+            self.config,
+            route=route,
+            nonce=self._nonce(request),
+            base_path=_root_path(request.scope),
+        )
 
-        return Response(
-            content=html,
+        injected = Response(
+            content=new_html,
             status_code=response.status_code,
-            headers=dict(response.headers),
             media_type="text/html",
         )
+        injected.raw_headers = self._injected_headers(
+            request, response, len(injected.body), injected=new_html != html
+        )
+        return injected
+
+    async def _inject_file(self, request: Request, response: Response, path: str) -> Response:
+        """Inject into a file-backed response by splicing byte ranges of the file."""
+        stat_result = await anyio.to_thread.run_sync(os.stat, path)
+        size = stat_result.st_size
+        offset = await anyio.to_thread.run_sync(
+            find_body_close_in_file, path, stat_result.st_mtime_ns, size
+        )
+        if offset is None:
+            offset, payload = size, b""
+        else:
+            injection = get_injection(
+                self.config,
+                route=request.url.path,
+                nonce=self._nonce(request),
+                base_path=_root_path(request.scope),
+            )
+            payload = injection.encode("utf-8")
+
+        return _FileSpliceResponse(
+            path=path,
+            size=size,
+            offset=offset,
+            payload=payload,
+            status_code=response.status_code,
+            raw_headers=self._injected_headers(
+                request, response, size + len(payload), injected=bool(payload)
+            ),
+        )
+
+    def _nonce(self, request: Request) -> str | None:
+        # Per-request CSP nonce set by the application or its CSP middleware
+        if not self.config.csp:
+            return None
+        return getattr(request.state, "csp_nonce", None)
+
+    def _injected_headers(
+        self,
+        request: Request,
+        response: Response,
+        content_length: int | None,
+        injected: bool,
+    ) -> list[tuple[bytes, bytes]]:
+        # Carry over the original headers (including repeated ones such as Set-Cookie),
+        # but let the new body determine Content-Length; None leaves it out.
+        headers = [
+            (key, value) for key, value in response.raw_headers if key != b"content-length"
+        ]
+        if content_length is not None:
+            headers.append((b"content-length", str(content_length).encode("latin-1")))
+        if not injected:
+            # Nothing for the browser to preload, and no script for the policy to allow
+            return headers
+        if loads_bundle_by_url(self.config, self._nonce(request)):
+            # Fallback for servers without Early Hints; proxies and CDNs may also
+            # turn this into a 103 of their own.
+            link = get_preload_link(_root_path(request.scope))
+            headers.append((b"link", link.encode("latin-1")))
+        if self.config.csp:
+            origin = f"{request.url.scheme}://{request.url.netloc}"
+            sources = get_csp_sources(
+                self.config, origin, self._nonce(request), _root_path(request.scope)
+            )
+            style_sources = get_csp_style_sources()
+            headers = [
+                (
+                    key,
+                    amend_policy(value.decode("latin-1"), sources, style_sources).encode(
+                        "latin-1"
+                    ),
+                )
+                if key.decode("latin-1").lower() in CSP_HEADERS
+                else (key, value)
+                for key, value in headers
+            ]
+        return headers
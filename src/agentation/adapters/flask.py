@@ -2,14 +2,111 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
-
+import os
+from collections.abc import Callable, Iterable, Iterator
+from typing import IO, TYPE_CHECKING
+
+from agentation.assets import (
+    ASSET_PREFIX,
+    IMMUTABLE_CACHE_CONTROL,
+    get_asset_content,
+    get_preload_link,
+)
 from agentation.config import AgentationConfig, is_enabled
-from agentation.injector import inject_agentation
+from agentation.csp import CSP_HEADERS, amend_policy, get_csp_sources, get_csp_style_sources
+from agentation.injector import (
+    find_body_close_in_file,
+    get_injection,
+    inject_agentation,
+    loads_bundle_by_url,
+)
 
 if TYPE_CHECKING:
+    from _typeshed import OptExcInfo
+    from _typeshed.wsgi import StartResponse, WSGIApplication, WSGIEnvironment
     from flask import Flask, Response
 
+# Read size for file ranges streamed by _FileSpliceIterable
+FILE_CHUNK_SIZE = 64 * 1024
+
+# WSGI environ key under which _inject leaves the CSP sources for _CSPMiddleware
+_CSP_SOURCES_KEY = "agentation.csp_sources"
+
+
+class _FileSpliceIterable:
+    """
+    WSGI body that streams a file with ``payload`` inserted at ``offset``.
+
+    This replaces the server's file wrapper, which can only send a whole file, so
+    the server's sendfile support is not used for injected pages.
+    """
+
+    def __init__(self, file: IO[bytes], size: int, offset: int, payload: bytes) -> None:
+        self.file = file
+        self.size = size
+        self.offset = offset
+        self.payload = payload
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield from self._read_range(0, self.offset)
+        yield self.payload
+        yield from self._read_range(self.offset, self.size - self.offset)
+
+    def _read_range(self, offset: int, count: int) -> Iterator[bytes]:
+        self.file.seek(offset)
+        while count > 0:
+            chunk = self.file.read(min(FILE_CHUNK_SIZE, count))
+            if not chunk:
+                return
+            count -= len(chunk)
+            yield chunk
+
+    def close(self) -> None:
+        self.file.close()
+
+
+def _response_file(response: Response) -> IO[bytes] | None:
+    """Return the open file behind a send_file response, if there is one."""
+    if response.status_code != 200:
+        return None
+    # Werkzeug's FileWrapper keeps the file in .file, wsgiref's and Gunicorn's in .filelike
+    wrapper = response.response
+    file: IO[bytes] | None = getattr(wrapper, "file", None) or getattr(wrapper, "filelike", None)
+    if file is None or not isinstance(getattr(file, "name", None), str):
+        return None
+    return file
+
+
+class _CSPMiddleware:
+    """
+    WSGI middleware that amends the CSP headers of responses Agentation injected into.
+
+    Flask runs after_request hooks in reverse registration order, so a hook cannot see
+    headers set by extensions registered before it (e.g. Flask-Talisman). Wrapping
+    wsgi_app sees the final headers whatever the order.
+    """
+
+    def __init__(self, wsgi_app: WSGIApplication) -> None:
+        self.wsgi_app = wsgi_app
+
+    def __call__(
+        self, environ: WSGIEnvironment, start_response: StartResponse
+    ) -> Iterable[bytes]:
+        def amending_start_response(
+            status: str, headers: list[tuple[str, str]], exc_info: OptExcInfo | None = None
+        ) -> Callable[[bytes], object]:
+            sources: tuple[str, ...] | None = environ.get(_CSP_SOURCES_KEY)
+            if sources is not None:
+                headers = [
+                    (key, amend_policy(value, sources, get_csp_style_sources()))
+                    if key.lower() in CSP_HEADERS
+                    else (key, value)
+                    for key, value in headers
+                ]
+            return start_response(status, headers, exc_info)
+
+        return self.wsgi_app(environ, amending_start_response)
+
 
 class AgentationFlask:
     """
@@ -43,6 +140,14 @@ class AgentationFlask:
             return
 
         app.after_request(self._inject)
+        if self.config.csp:
+            app.wsgi_app = _CSPMiddleware(app.wsgi_app)  # type: ignore[method-assign]
+
+        app.add_url_rule(
+            f"{ASSET_PREFIX}/<path:filename>",
+            endpoint="agentation_asset",
+            view_func=self._serve_asset,
+        )
 
         if not hasattr(app, "extensions"):
             app.extensions = {}
@@ -58,8 +163,69 @@ class AgentationFlask:
         from flask import request
 
         route = request.endpoint or request.path
-        html = response.get_data(as_text=True)
-        html = inject_agentation(html, self.config, route=route)
-        response.set_data(html)
+        # Per-request CSP nonce, as set by e.g. Flask-Talisman
+        nonce: str | None = getattr(request, "csp_nonce", None) if self.config.csp else None
+
+        if response.direct_passthrough:
+            # send_file responses are streamed from disk; anything else in passthrough
+            # mode cannot be read without breaking it, so it is left alone
+            file = _response_file(response)
+            if file is None or not self._inject_file(response, file, route, nonce):
+                return response
+        else:
+            html = response.get_data(as_text=True)
+            new_html = inject_agentation(
+                html, self.config, route=route, nonce=nonce, base_path=request.script_root
+            )
+            if new_html == html:
+                # No </body>: nothing to preload, and no script for the policy to allow
+                return response
+            response.set_data(new_html)
+
+        if loads_bundle_by_url(self.config, nonce):
+            # WSGI has no way to send 103 Early Hints, so only the Link header is set
+            response.headers.add("Link", get_preload_link(request.script_root))
+
+        if self.config.csp:
+            # The policy may not be set yet; _CSPMiddleware amends the final headers
+            sources = get_csp_sources(
+                self.config, request.host_url.rstrip("/"), nonce, request.script_root
+            )
+            request.environ[_CSP_SOURCES_KEY] = sources
+
+        return response
+
+    def _inject_file(
+        self, response: Response, file: IO[bytes], route: str, nonce: str | None
+    ) -> bool:
+        """
+        Splice the injection into a file-backed response without reading the file.
+
+        Returns whether the file had a </body> to inject before.
+        """
+        stat_result = os.fstat(file.fileno())
+        offset = find_body_close_in_file(file.name, stat_result.st_mtime_ns, stat_result.st_size)
+        if offset is None:
+            return False
+
+        from flask import request
+
+        injection = get_injection(
+            self.config, route=route, nonce=nonce, base_path=request.script_root
+        )
+        payload = injection.encode("utf-8")
+        response.response = _FileSpliceIterable(file, stat_result.st_size, offset, payload)
+        response.content_length = stat_result.st_size + len(payload)
+        return True
+
+    def _serve_asset(self, filename: str) -> Response:
+        """Serve the bootstrap and toolbar chunks loaded by injected pages."""
+        from flask import abort, current_app
+
+        asset = get_asset_content(f"{ASSET_PREFIX}/{filename}")
+        if asset is None:
+            abort(404)
 
+        response = current_app.response_class(asset, mimetype="text/javascript")
+        response.headers["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
         return response
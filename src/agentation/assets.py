@@ -2,23 +2,153 @@
 
 from __future__ import annotations
 
+import base64
+import hashlib
+import json
 import sys
-from functools import lru_cache
+from functools import cache, lru_cache
 from importlib import resources
+from typing import TypedDict
 
 if sys.version_info >= (3, 11):
     from importlib.resources.abc import Traversable
 else:
     from importlib.abc import Traversable
 
+# URL prefix under which the adapters serve Agentation assets
+ASSET_PREFIX = "/__agentation__"
+
+# URL prefix for the lazily loaded toolbar chunks
+CHUNK_PREFIX = f"{ASSET_PREFIX}/chunks/"
+
+# Asset URLs are content-hashed, so a response never changes for a given URL
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+class ChunkManifest(TypedDict):
+    """Contents of static/chunks/manifest.json, written by the JS build."""
+
+    # Entry name (e.g. "toolbar") -> hashed chunk file name
+    entries: dict[str, str]
+    # Every chunk file that may be served, including shared chunks
+    files: list[str]
+    # CSP hash sources ("sha384-...") of the stylesheets the JS adds as <style>
+    styles: list[str]
+
+
+def _chunks_dir() -> Traversable:
+    return resources.files("agentation").joinpath("static").joinpath("chunks")
+
 
 @lru_cache(maxsize=1)
 def get_js_content() -> str:
-    """Load the bundled JavaScript content."""
+    """Load the bootstrap JavaScript injected into every page."""
     try:
         files: Traversable = resources.files("agentation")
-        js_path: Traversable = files.joinpath("static").joinpath("agentation.min.js")
+        js_path: Traversable = files.joinpath("static").joinpath("bootstrap.min.js")
         return js_path.read_text(encoding="utf-8")
     except (TypeError, AttributeError):
-        with resources.open_text("agentation.static", "agentation.min.js") as f:
+        with resources.open_text("agentation.static", "bootstrap.min.js") as f:
             return f.read()
+
+
+@lru_cache(maxsize=1)
+def _bundle_digest() -> str:
+    return hashlib.sha256(get_js_content().encode("utf-8")).hexdigest()[:12]
+
+
+def get_bundle_path(base_path: str = "") -> str:
+    """
+    URL path of the bootstrap, content-hashed so it can be cached forever.
+
+    Args:
+        base_path: Path the app is mounted at (ASGI root_path, WSGI SCRIPT_NAME)
+    """
+    return f"{base_path}{ASSET_PREFIX}/bootstrap.{_bundle_digest()}.min.js"
+
+
+@lru_cache(maxsize=1)
+def get_script_hash() -> str:
+    """CSP hash source of the inline bootstrap script, e.g. "sha384-..."."""
+    digest = hashlib.sha384(get_js_content().encode("utf-8")).digest()
+    return "sha384-" + base64.b64encode(digest).decode("ascii")
+
+
+@lru_cache(maxsize=1)
+def get_style_hashes() -> tuple[str, ...]:
+    """CSP hash sources of the toolbar's <style> elements, e.g. ("sha384-...",)."""
+    # Hashed by the JS build, which inlines the stylesheets into the bundles
+    return tuple(get_chunk_manifest()["styles"])
+
+
+def get_preload_link(base_path: str = "") -> str:
+    """Link header value that tells the browser to fetch the bootstrap early."""
+    return f"<{get_bundle_path(base_path)}>; rel=preload; as=script"
+
+
+@lru_cache(maxsize=1)
+def get_chunk_manifest() -> ChunkManifest:
+    """Load the manifest of toolbar chunks produced by the JS build."""
+    manifest: ChunkManifest = json.loads(
+        _chunks_dir().joinpath("manifest.json").read_text(encoding="utf-8")
+    )
+    return manifest
+
+
+@cache
+def _read_chunk(file_name: str) -> str:
+    return _chunks_dir().joinpath(file_name).read_text(encoding="utf-8")
+
+
+@lru_cache(maxsize=1)
+def get_chunks_digest() -> str:
+    """
+    Hash of every chunk's name and content.
+
+    Chunk URLs are served with immutable caching, so they include this hash
+    rather than relying on the file names: editing any chunk gives them all new
+    URLs. The chunks import each other by relative URL, so they share one digest.
+    """
+    digest = hashlib.sha256()
+    for file_name in sorted(get_chunk_manifest()["files"]):
+        digest.update(file_name.encode("utf-8") + b"\0")
+        digest.update(_read_chunk(file_name).encode("utf-8") + b"\0")
+    return digest.hexdigest()[:12]
+
+
+def get_chunk_urls(base_path: str = "") -> dict[str, str]:
+    """
+    URLs of the chunk entry points, keyed by entry name, for the bootstrap.
+
+    Args:
+        base_path: Path the app is mounted at (ASGI root_path, WSGI SCRIPT_NAME)
+    """
+    entries = get_chunk_manifest()["entries"]
+    prefix = f"{base_path}{CHUNK_PREFIX}{get_chunks_digest()}/"
+    return {name: prefix + file_name for name, file_name in entries.items()}
+
+
+def get_chunk_content(file_name: str) -> str | None:
+    """Load a chunk by file name, or None if it is not listed in the manifest."""
+    # Only manifest entries are read (and cached), which also rules out path traversal
+    if file_name not in get_chunk_manifest()["files"]:
+        return None
+    return _read_chunk(file_name)
+
+
+def get_asset_content(path: str) -> str | None:
+    """
+    Look up the asset served at ``path``, or None if there is none.
+
+    ``path`` is relative to the app's mount point, i.e. without the base path that
+    get_bundle_path and get_chunk_urls were given.
+    """
+    if path == get_bundle_path():
+        return get_js_content()
+    if path.startswith(CHUNK_PREFIX):
+        digest, _, file_name = path[len(CHUNK_PREFIX) :].partition("/")
+        # URLs from an older set of chunks must not be cached with today's content
+        if digest != get_chunks_digest():
+            return None
+        return get_chunk_content(file_name)
+    return None
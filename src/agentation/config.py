@@ -29,6 +29,10 @@ class AgentationConfig:
     auto_clear_on_copy: bool = False
     include_route: bool = True
 
+    # Delivery (server-side only, not passed to the toolbar)
+    preload: bool = False
+    csp: bool = False
+
     def to_dict(self) -> dict[str, Any]:
         """Convert config to dict for JSON serialization (camelCase keys for JS)."""
         return {
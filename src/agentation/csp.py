@@ -0,0 +1,131 @@
+"""Content-Security-Policy support for Agentation."""
+
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+
+from agentation.assets import ASSET_PREFIX, get_script_hash, get_style_hashes
+from agentation.config import AgentationConfig
+
+# Response headers whose policies are amended (report-only too, to avoid noise)
+CSP_HEADERS = ("content-security-policy", "content-security-policy-report-only")
+
+# Directives that control <script> elements, most specific first
+_SCRIPT_DIRECTIVES = ("script-src-elem", "script-src")
+
+# Directives that control <style> elements, most specific first
+_STYLE_DIRECTIVES = ("style-src-elem", "style-src")
+
+_NONCE_RE = re.compile(r"'nonce-[^']*'", re.IGNORECASE)
+_PLACEHOLDER_RE = re.compile(r"'nonce-#(\d+)'")
+
+
+def get_csp_sources(
+    config: AgentationConfig, origin: str, nonce: str | None, base_path: str = ""
+) -> tuple[str, ...]:
+    """
+    Sources a policy must allow for the toolbar to load.
+
+    Args:
+        config: Agentation configuration
+        origin: Origin of the page, e.g. "https://example.com"
+        nonce: The request's CSP nonce if the injected script carries it
+        base_path: Path the app is mounted at (ASGI root_path, WSGI SCRIPT_NAME)
+
+    Returns:
+        The nonce if there is one (the policy may only use it for other directives,
+        or not at all), else the hash of the inline bootstrap, and the asset URL prefix
+    """
+    asset_source = f"{origin}{base_path}{ASSET_PREFIX}/"
+    if nonce:
+        return (f"'nonce-{nonce}'", asset_source)
+    # Without a nonce the bootstrap is always inlined (see loads_bundle_by_url)
+    return (f"'{get_script_hash()}'", asset_source)
+
+
+def get_csp_style_sources() -> tuple[str, ...]:
+    """Sources a policy must allow for the toolbar's <style> elements."""
+    return tuple(f"'{style_hash}'" for style_hash in get_style_hashes())
+
+
+def amend_policy(
+    policy: str, sources: tuple[str, ...], style_sources: tuple[str, ...] = ()
+) -> str:
+    """
+    Add ``sources`` to the script directives of a Content-Security-Policy.
+
+    Per-request nonces are swapped for placeholders before the policy is parsed, so
+    each distinct policy template is only parsed once per process, even when every
+    response carries a new nonce.
+
+    Args:
+        policy: The policy header value set by the application
+        sources: Source expressions from get_csp_sources
+        style_sources: Source expressions for the style directives, from
+            get_csp_style_sources
+
+    Returns:
+        The amended policy, or ``policy`` unchanged if it restricts neither scripts
+        nor styles
+    """
+    # Numbered by first appearance; "#" cannot occur in a real (base64) nonce
+    nonces: dict[str, str] = {}
+
+    def to_placeholder(match: re.Match[str]) -> str:
+        return nonces.setdefault(match.group(), f"'nonce-#{len(nonces)}'")
+
+    template = _NONCE_RE.sub(to_placeholder, policy)
+    template_sources = tuple(_NONCE_RE.sub(to_placeholder, source) for source in sources)
+    amended = _amend_template(template, template_sources, style_sources)
+    if not nonces:
+        return amended
+
+    originals = list(nonces)
+    return _PLACEHOLDER_RE.sub(lambda match: originals[int(match.group(1))], amended)
+
+
+@lru_cache(maxsize=128)
+def _amend_template(
+    policy: str, sources: tuple[str, ...], style_sources: tuple[str, ...] = ()
+) -> str:
+    directives = [d.strip() for d in policy.split(";") if d.strip()]
+    names = [d.split(None, 1)[0].lower() for d in directives]
+
+    _extend_directives(directives, names, _SCRIPT_DIRECTIVES, sources)
+    if style_sources:
+        _extend_directives(directives, names, _STYLE_DIRECTIVES, style_sources)
+    return "; ".join(directives)
+
+
+def _extend_directives(
+    directives: list[str], names: list[str], group: tuple[str, ...], sources: tuple[str, ...]
+) -> None:
+    # group is e.g. _SCRIPT_DIRECTIVES; its last name is the one default-src stands in for
+    targets = [name for name in group if name in names]
+    if not targets:
+        if "default-src" not in names:
+            return
+        # The group falls back to default-src; give it its own copy to extend
+        fallback = group[-1]
+        default_values = directives[names.index("default-src")].split()[1:]
+        directives.append(" ".join([fallback, *default_values]))
+        names.append(fallback)
+        targets = [fallback]
+
+    for i, name in enumerate(names):
+        if name not in targets:
+            continue
+        directive_name, *values = directives[i].split()
+        lowered = [value.lower() for value in values]
+        additions = list(sources)
+        if "'unsafe-inline'" in lowered and not any(
+            value.startswith(("'nonce-", "'sha")) for value in lowered
+        ):
+            # Inline content is already allowed, and adding a hash or nonce would
+            # switch 'unsafe-inline' off for the page's own scripts or styles
+            additions = [s for s in additions if not s.startswith(("'sha", "'nonce-"))]
+        # 'none' cannot be combined with other sources
+        values = [v for v in values if v.lower() != "'none'"]
+        values += [s for s in additions if s not in values]
+        directives[i] = " ".join([directive_name, *values])
@@ -3,45 +3,144 @@
 from __future__ import annotations
 
 import json
+import mmap
+import re
+from functools import lru_cache
+from html import escape
 from typing import Any
 
-from agentation.assets import get_js_content
+from agentation.assets import get_bundle_path, get_chunk_urls, get_js_content
 from agentation.config import AgentationConfig
 
+# ASCII-only case folding: str.lower() can change string length (e.g. "İ"),
+# which would shift the offset of the match relative to the original HTML.
+_BODY_CLOSE_RE = re.compile(r"</body>", re.IGNORECASE | re.ASCII)
 
-def inject_agentation(
-    html: str,
+# Bytes patterns only fold ASCII case. "</body>" is pure ASCII, so in UTF-8 it can
+# never start inside a multibyte character and byte and str matches agree.
+_BODY_CLOSE_BYTES_RE = re.compile(rb"</body>", re.IGNORECASE)
+
+
+def loads_bundle_by_url(config: AgentationConfig, nonce: str | None = None) -> bool:
+    """
+    Whether get_injection loads the bootstrap by URL rather than inlining it.
+
+    In CSP mode without a nonce the bootstrap is inlined even with preload, so the
+    policy can allow it by hash: host sources are ignored under 'strict-dynamic'.
+    """
+    return config.preload and (not config.csp or bool(nonce))
+
+
+def get_injection(
     config: AgentationConfig,
     route: str | None = None,
+    nonce: str | None = None,
+    base_path: str = "",
 ) -> str:
     """
-    Inject Agentation JavaScript into HTML response.
+    Build the markup that inject_agentation inserts before </body>.
 
     Args:
-        html: The HTML content to inject into
         config: Agentation configuration
         route: Optional route/path for context in output
+        nonce: Optional CSP nonce for the script tag (only used when config.csp is set)
+        base_path: Path the app is mounted at, prepended to asset URLs
 
     Returns:
-        Modified HTML with Agentation injected before </body>
+        The <script> markup for the given config and route
     """
-    body_close_lower = html.lower().find("</body>")
-    if body_close_lower == -1:
-        return html
-
     js_config: dict[str, Any] = config.to_dict()
     if route and config.include_route:
         js_config["route"] = route
+    # Where the bootstrap loads the toolbar from when it is first opened
+    js_config["chunks"] = get_chunk_urls(base_path)
 
-    js_content = get_js_content()
     config_json = json.dumps(js_config, separators=(",", ":"))
     config_json = config_json.replace("</", "<\\/")  # Escape closing tags
 
-    injection = f"""<script>
+    if config.csp:
+        # The per-route config goes in a data block, which CSP does not apply to,
+        # so the executable script is identical on every page and can be hashed
+        nonce_attr = f' nonce="{escape(nonce)}"' if nonce else ""
+        # "<" only occurs inside JSON strings; escaping it also rules out "<!--"
+        data_json = config_json.replace("<", "\\u003c")
+        data_block = f'<script type="application/json" id="agentation-config">{data_json}</script>'
+
+        if loads_bundle_by_url(config, nonce):
+            bundle_path = get_bundle_path(base_path)
+            return f'{data_block}\n<script src="{bundle_path}"{nonce_attr}></script>\n'
+        return f"{data_block}\n<script{nonce_attr}>{get_js_content()}</script>\n"
+
+    if config.preload:
+        # The adapters serve the bootstrap and send a preload hint for it
+        return f"""<script>
+window.__AGENTATION_CONFIG__ = {config_json};
+</script>
+<script src="{get_bundle_path(base_path)}"></script>
+"""
+
+    js_content = get_js_content()
+    return f"""<script>
 window.__AGENTATION_CONFIG__ = {config_json};
 {js_content}
 </script>
 """
 
-    body_close_pos = body_close_lower
+
+def inject_agentation(
+    html: str,
+    config: AgentationConfig,
+    route: str | None = None,
+    nonce: str | None = None,
+    base_path: str = "",
+) -> str:
+    """
+    Inject Agentation JavaScript into HTML response.
+
+    Args:
+        html: The HTML content to inject into
+        config: Agentation configuration
+        route: Optional route/path for context in output
+        nonce: Optional CSP nonce for the script tag (only used when config.csp is set)
+        base_path: Path the app is mounted at, prepended to asset URLs
+
+    Returns:
+        Modified HTML with Agentation injected before </body>
+    """
+    match = _BODY_CLOSE_RE.search(html)
+    if match is None:
+        return html
+
+    body_close_pos = match.start()
+    injection = get_injection(config, route, nonce, base_path)
     return html[:body_close_pos] + injection + html[body_close_pos:]
+
+
+@lru_cache(maxsize=256)
+def find_body_close_in_file(path: str, mtime_ns: int, size: int) -> int | None:
+    """
+    Find the byte offset of the first </body> in a UTF-8 HTML file.
+
+    The file is memory-mapped rather than read, so large pages are scanned without
+    being copied into Python. Results are cached; ``mtime_ns`` and ``size`` (from
+    os.stat) are part of the cache key so that a modified file is scanned again.
+
+    Args:
+        path: Path of the HTML file
+        mtime_ns: Modification time of the file in nanoseconds
+        size: Size of the file in bytes
+
+    Returns:
+        Byte offset at which inject_agentation would insert, or None if there is no </body>
+    """
+    if size == 0:
+        return None
+
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        # The first match is needed to agree with inject_agentation, so the scan runs
+        # forward; the regex engine walks the mapping without creating a bytes copy.
+        match = _BODY_CLOSE_BYTES_RE.search(mm)
+        offset = None if match is None else match.start()
+        # The match holds a buffer export that would stop the mapping from closing
+        del match
+    return offset
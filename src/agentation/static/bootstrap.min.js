@@ -0,0 +1,38 @@
+(()=>{var u=`<svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round">
+    <circle cx="12" cy="12" r="10"/>
+    <path d="M12 16v-4"/>
+    <path d="M12 8h.01"/>
+  </svg>`;function m(e){let t=e.toLowerCase().split("+");return{key:t[t.length-1],ctrl:t.includes("ctrl"),shift:t.includes("shift"),alt:t.includes("alt"),meta:t.includes("meta")||t.includes("cmd")}}function h(e,t){let n=m(t),s=e.key.toLowerCase()===n.key,o=e.ctrlKey===n.ctrl,r=e.shiftKey===n.shift,a=e.altKey===n.alt,l=e.metaKey===n.meta;return s&&o&&r&&a&&l}var v="agentation-annotations-";function g(){return v+window.location.pathname}function f(){try{let e=g(),t=localStorage.getItem(e);if(!t)return[];let n=JSON.parse(t),s=Date.now(),o=7*24*60*60*1e3,r=n.filter(a=>a.timestamp&&s-a.timestamp<o);return r.length!==n.length&&w(r),r}catch(e){return console.warn("Agentation: Failed to load annotations",e),[]}}function w(e){try{let t=g();e.length===0?localStorage.removeItem(t):localStorage.setItem(t,JSON.stringify(e))}catch(t){console.warn("Agentation: Failed to save annotations",t)}}var p=`.agentation-launcher {
+  position: fixed;
+  z-index: 2147483647;
+  display: flex;
+  align-items: center;
+  justify-content: center;
+  width: 44px;
+  height: 44px;
+  padding: 0;
+  border: none;
+  border-radius: 50%;
+  background: #1f2937;
+  color: #f3f4f6;
+  box-shadow: 0 4px 20px rgba(0, 0, 0, 0.25);
+  cursor: pointer;
+}
+
+.agentation-launcher svg {
+  width: 20px;
+  height: 20px;
+}
+
+.agentation-launcher.light {
+  background: #ffffff;
+  color: #1f2937;
+}
+
+@media (prefers-color-scheme: light) {
+  .agentation-launcher.auto {
+    background: #ffffff;
+    color: #1f2937;
+  }
+}
+`;(function(){"use strict";let e=document.getElementById("agentation-config"),t=window.__AGENTATION_CONFIG__||(e?JSON.parse(e.textContent):{}),n=t.chunks||{},s=t.keyboardShortcut||"ctrl+shift+a",o=null,r=null;function a(i){return r||(document.removeEventListener("keydown",l,!0),r=import(n.toolbar).then(c=>{o&&(o.remove(),o=null),c.initToolbar(t,i)})),r}function l(i){h(i,s)&&(i.preventDefault(),i.stopPropagation(),a({active:!0}))}function k(){let i=document.createElement("style");i.id="agentation-launcher-styles",i.textContent=p,document.head.appendChild(i),o=document.createElement("button"),o.type="button",o.className=`agentation-launcher ${t.theme||"auto"}`,o.title="Agentation",o.innerHTML=u;let[c,y]=(t.position||"bottom-right").split("-");o.style[c]="16px",o.style[y]="16px",o.addEventListener("click",()=>a({expanded:!0})),document.body.appendChild(o)}function d(){if(f().length>0){a({});return}k(),document.addEventListener("keydown",l,!0)}document.readyState==="loading"?document.addEventListener("DOMContentLoaded",d):d(),window.__AGENTATION_LOADED__=!0})();})();
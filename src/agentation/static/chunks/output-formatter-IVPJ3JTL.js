@@ -0,0 +1,5 @@
+function p(e,o={}){let{detail:i="standard",format:t="markdown",route:s=null}=o;return t==="json"?f(e,i,s):l(e,i,s)}function l(e,o,i){if(e.length===0)return`# No annotations
+
+No elements have been annotated.`;if(o==="compact")return u(e);let t=[];return i?t.push(`## Page Feedback: ${i}`):t.push("## Page Feedback"),t.push(`**Viewport:** ${window.innerWidth}x${window.innerHeight}`),o==="forensic"&&(t.push(`**URL:** ${window.location.href}`),t.push(`**User Agent:** ${navigator.userAgent}`),t.push(`**Device Pixel Ratio:** ${window.devicePixelRatio}`)),t.push(""),e.forEach((s,r)=>{if(t.push(`### ${r+1}. ${s.element}`),t.push(""),o==="forensic"&&s.fullPath?t.push(`**Full DOM Path:** ${s.fullPath}`):t.push(`**Location:** \`${s.elementPath}\``),(o==="detailed"||o==="forensic")&&s.cssClasses&&t.push(`**Classes:** ${s.cssClasses}`),(o==="detailed"||o==="forensic")&&s.boundingBox){let c=s.boundingBox;o==="forensic"?(t.push(`**Position:** x:${c.x}, y:${c.y} (${c.width}\xD7${c.height}px)`),t.push(`**Annotation at:** ${s.x.toFixed(1)}% from left, ${Math.round(s.y)}px from top`)):t.push(`**Position:** ${c.x}px, ${c.y}px (${c.width}\xD7${c.height}px)`)}s.selectedText&&t.push(`**Selected text:** "${s.selectedText}"`),o==="forensic"&&s.computedStyles&&t.push(`**Computed Styles:** ${s.computedStyles}`),o==="forensic"&&s.accessibility&&t.push(`**Accessibility:** ${s.accessibility}`),(o==="detailed"||o==="forensic")&&s.nearbyText&&t.push(`**Context:** "${s.nearbyText}"`),o==="forensic"&&s.nearbyElements&&t.push(`**Nearby Elements:** ${s.nearbyElements}`),t.push(`**Feedback:** ${s.comment||"(no feedback provided)"}`),t.push("")}),t.join(`
+`)}function u(e){return e.map((o,i)=>`${i+1}. ${o.element}: ${o.comment||"(no feedback)"}`).join(`
+`)}function f(e,o,i){let t={route:i||window.location.pathname,viewport:{width:window.innerWidth,height:window.innerHeight},annotations:e.map(s=>n(s,o))};return o==="forensic"&&(t.url=window.location.href,t.userAgent=navigator.userAgent,t.devicePixelRatio=window.devicePixelRatio,t.timestamp=Date.now()),JSON.stringify(t,null,2)}function n(e,o){let i={element:e.element,location:e.elementPath,feedback:e.comment||null};return e.selectedText&&(i.selectedText=e.selectedText),(o==="detailed"||o==="forensic")&&(e.cssClasses&&(i.classes=e.cssClasses.split(" ")),e.boundingBox&&(i.position=e.boundingBox),e.nearbyText&&(i.context=e.nearbyText)),o==="forensic"&&(e.fullPath&&(i.fullDOMPath=e.fullPath),e.computedStyles&&(i.computedStyles=e.computedStyles),e.accessibility&&(i.accessibility=e.accessibility),e.nearbyElements&&(i.nearbyElements=e.nearbyElements),i.annotationPosition={xPercent:e.x,yPixels:e.y},i.timestamp=e.timestamp,i.isFixed=e.isFixed||!1,i.isMultiSelect=e.isMultiSelect||!1),i}async function d(e){try{return await navigator.clipboard.writeText(e),!0}catch(o){console.warn("Agentation: Clipboard write failed",o);try{let i=document.createElement("textarea");return i.value=e,i.style.position="fixed",i.style.opacity="0",document.body.appendChild(i),i.select(),document.execCommand("copy"),document.body.removeChild(i),!0}catch{return!1}}}export{d as copyToClipboard,p as formatOutput};
@@ -0,0 +1,389 @@
+var st=`<svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round">
+    <circle cx="12" cy="12" r="10"/>
+    <path d="M12 16v-4"/>
+    <path d="M12 8h.01"/>
+  </svg>`,g={logo:st,pause:`<svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round">
+    <rect x="6" y="4" width="4" height="16"/>
+    <rect x="14" y="4" width="4" height="16"/>
+  </svg>`,play:`<svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round">
+    <polygon points="5 3 19 12 5 21 5 3"/>
+  </svg>`,eye:`<svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round">
+    <path d="M1 12s4-8 11-8 11 8 11 8-4 8-11 8-11-8-11-8z"/>
+    <circle cx="12" cy="12" r="3"/>
+  </svg>`,eyeOff:`<svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round">
+    <path d="M17.94 17.94A10.07 10.07 0 0 1 12 20c-7 0-11-8-11-8a18.45 18.45 0 0 1 5.06-5.94M9.9 4.24A9.12 9.12 0 0 1 12 4c7 0 11 8 11 8a18.5 18.5 0 0 1-2.16 3.19m-6.72-1.07a3 3 0 1 1-4.24-4.24"/>
+    <line x1="1" y1="1" x2="23" y2="23"/>
+  </svg>`,copy:`<svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round">
+    <rect x="9" y="9" width="13" height="13" rx="2" ry="2"/>
+    <path d="M5 15H4a2 2 0 0 1-2-2V4a2 2 0 0 1 2-2h9a2 2 0 0 1 2 2v1"/>
+  </svg>`,check:`<svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round">
+    <polyline points="20 6 9 17 4 12"/>
+  </svg>`,trash:`<svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round">
+    <polyline points="3 6 5 6 21 6"/>
+    <path d="M19 6v14a2 2 0 0 1-2 2H7a2 2 0 0 1-2-2V6m3 0V4a2 2 0 0 1 2-2h4a2 2 0 0 1 2 2v2"/>
+  </svg>`,settings:`<svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round">
+    <circle cx="12" cy="12" r="3"/>
+    <path d="M19.4 15a1.65 1.65 0 0 0 .33 1.82l.06.06a2 2 0 0 1 0 2.83 2 2 0 0 1-2.83 0l-.06-.06a1.65 1.65 0 0 0-1.82-.33 1.65 1.65 0 0 0-1 1.51V21a2 2 0 0 1-2 2 2 2 0 0 1-2-2v-.09A1.65 1.65 0 0 0 9 19.4a1.65 1.65 0 0 0-1.82.33l-.06.06a2 2 0 0 1-2.83 0 2 2 0 0 1 0-2.83l.06-.06a1.65 1.65 0 0 0 .33-1.82 1.65 1.65 0 0 0-1.51-1H3a2 2 0 0 1-2-2 2 2 0 0 1 2-2h.09A1.65 1.65 0 0 0 4.6 9a1.65 1.65 0 0 0-.33-1.82l-.06-.06a2 2 0 0 1 0-2.83 2 2 0 0 1 2.83 0l.06.06a1.65 1.65 0 0 0 1.82.33H9a1.65 1.65 0 0 0 1-1.51V3a2 2 0 0 1 2-2 2 2 0 0 1 2 2v.09a1.65 1.65 0 0 0 1 1.51 1.65 1.65 0 0 0 1.82-.33l.06-.06a2 2 0 0 1 2.83 0 2 2 0 0 1 0 2.83l-.06.06a1.65 1.65 0 0 0-.33 1.82V9a1.65 1.65 0 0 0 1.51 1H21a2 2 0 0 1 2 2 2 2 0 0 1-2 2h-.09a1.65 1.65 0 0 0-1.51 1z"/>
+  </svg>`,close:`<svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round">
+    <line x1="18" y1="6" x2="6" y2="18"/>
+    <line x1="6" y1="6" x2="18" y2="18"/>
+  </svg>`,chevronDown:`<svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round">
+    <polyline points="6 9 12 15 18 9"/>
+  </svg>`};var I=`/* Agentation Toolbar */
+.agentation-toolbar {
+  position: fixed;
+  z-index: 2147483647;
+  font-family: system-ui, -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+  font-size: 14px;
+  line-height: 1.4;
+  box-sizing: border-box;
+}
+
+.agentation-toolbar *,
+.agentation-toolbar *::before,
+.agentation-toolbar *::after {
+  box-sizing: border-box;
+}
+
+/* Toolbar inner container */
+.agentation-toolbar-inner {
+  display: flex;
+  align-items: center;
+  gap: 8px;
+  padding: 8px 12px;
+  background: var(--agentation-bg, #1f2937);
+  border-radius: 12px;
+  box-shadow: 0 4px 20px rgba(0, 0, 0, 0.25);
+  transition: all 0.2s ease;
+}
+
+/* Collapsed state */
+.agentation-toolbar.collapsed .agentation-toolbar-inner {
+  padding: 0;
+  width: 44px;
+  height: 44px;
+  border-radius: 50%;
+  justify-content: center;
+  cursor: pointer;
+}
+
+.agentation-toolbar.collapsed .agentation-controls {
+  display: none;
+}
+
+/* Buttons */
+.agentation-btn {
+  display: flex;
+  align-items: center;
+  justify-content: center;
+  width: 32px;
+  height: 32px;
+  padding: 0;
+  border: none;
+  border-radius: 8px;
+  background: transparent;
+  color: var(--agentation-text, #f3f4f6);
+  cursor: pointer;
+  transition: all 0.15s ease;
+}
+
+.agentation-btn:hover {
+  background: var(--agentation-hover, #374151);
+}
+
+.agentation-btn.active {
+  background: var(--agentation-accent, #3b82f6);
+}
+
+.agentation-btn svg {
+  width: 18px;
+  height: 18px;
+}
+
+/* Badge (collapsed state) */
+.agentation-badge {
+  position: relative;
+  display: flex;
+  align-items: center;
+  justify-content: center;
+  width: 100%;
+  height: 100%;
+}
+
+.agentation-badge-count {
+  position: absolute;
+  top: -4px;
+  right: -4px;
+  min-width: 18px;
+  height: 18px;
+  padding: 0 5px;
+  background: var(--agentation-accent, #3b82f6);
+  border-radius: 9px;
+  font-size: 11px;
+  font-weight: 600;
+  color: white;
+  display: flex;
+  align-items: center;
+  justify-content: center;
+}
+
+/* Controls section */
+.agentation-controls {
+  display: flex;
+  align-items: center;
+  gap: 4px;
+}
+
+/* Annotation count */
+.agentation-count {
+  min-width: 28px;
+  padding: 4px 8px;
+  background: var(--agentation-accent, #3b82f6);
+  border-radius: 14px;
+  font-size: 12px;
+  font-weight: 600;
+  color: white;
+  text-align: center;
+}
+
+/* Divider */
+.agentation-divider {
+  width: 1px;
+  height: 20px;
+  background: var(--agentation-border, #4b5563);
+  margin: 0 4px;
+}
+
+/* Markers */
+.agentation-marker {
+  position: absolute;
+  width: 24px;
+  height: 24px;
+  margin-left: -12px;
+  margin-top: -12px;
+  border-radius: 50%;
+  background: var(--agentation-accent, #3b82f6);
+  color: white;
+  font-size: 12px;
+  font-weight: 600;
+  font-family: system-ui, -apple-system, sans-serif;
+  display: flex;
+  align-items: center;
+  justify-content: center;
+  cursor: pointer;
+  z-index: 2147483646;
+  box-shadow: 0 2px 8px rgba(0, 0, 0, 0.2);
+  transition: transform 0.15s ease;
+  pointer-events: auto;
+}
+
+.agentation-marker:hover {
+  transform: scale(1.15);
+}
+
+.agentation-marker.multi-select {
+  background: #10b981;
+}
+
+/* Fixed markers container */
+.agentation-markers-fixed {
+  position: fixed;
+  top: 0;
+  left: 0;
+  width: 100%;
+  height: 100%;
+  pointer-events: none;
+  z-index: 2147483645;
+}
+
+/* Scrolling markers container */
+.agentation-markers-scroll {
+  position: absolute;
+  top: 0;
+  left: 0;
+  width: 100%;
+  pointer-events: none;
+  z-index: 2147483644;
+}
+
+/* Hover highlight */
+[data-agentation-highlight] {
+  outline: 2px solid var(--agentation-accent, #3b82f6) !important;
+  outline-offset: 2px !important;
+}
+
+/* Popup */
+.agentation-popup {
+  position: fixed;
+  z-index: 2147483647;
+  padding: 12px;
+  background: var(--agentation-bg, #1f2937);
+  border-radius: 12px;
+  box-shadow: 0 4px 20px rgba(0, 0, 0, 0.3);
+  font-family: system-ui, -apple-system, sans-serif;
+}
+
+.agentation-popup-header {
+  display: flex;
+  align-items: center;
+  gap: 8px;
+  margin-bottom: 8px;
+  color: var(--agentation-text, #f3f4f6);
+  font-size: 12px;
+  opacity: 0.8;
+}
+
+.agentation-popup-input {
+  width: 300px;
+  min-height: 60px;
+  padding: 10px;
+  border: 1px solid var(--agentation-border, #4b5563);
+  border-radius: 8px;
+  background: transparent;
+  color: var(--agentation-text, #f3f4f6);
+  font-size: 14px;
+  font-family: inherit;
+  resize: vertical;
+}
+
+.agentation-popup-input:focus {
+  outline: none;
+  border-color: var(--agentation-accent, #3b82f6);
+}
+
+.agentation-popup-hint {
+  margin-top: 8px;
+  font-size: 11px;
+  color: var(--agentation-text, #f3f4f6);
+  opacity: 0.6;
+}
+
+/* Drag selection box */
+.agentation-drag-box {
+  position: fixed;
+  border: 2px dashed var(--agentation-accent, #3b82f6);
+  background: rgba(59, 130, 246, 0.1);
+  pointer-events: none;
+  z-index: 2147483646;
+}
+
+/* Drag highlight */
+.agentation-drag-highlight {
+  position: absolute;
+  background: rgba(59, 130, 246, 0.2);
+  border: 2px solid var(--agentation-accent, #3b82f6);
+  pointer-events: none;
+  z-index: 2147483645;
+}
+
+/* Theme: Light mode */
+.agentation-toolbar.light {
+  --agentation-bg: #ffffff;
+  --agentation-text: #1f2937;
+  --agentation-hover: #f3f4f6;
+  --agentation-border: #d1d5db;
+}
+
+.agentation-popup.light {
+  --agentation-bg: #ffffff;
+  --agentation-text: #1f2937;
+  --agentation-border: #d1d5db;
+}
+
+/* Auto theme */
+@media (prefers-color-scheme: light) {
+  .agentation-toolbar.auto,
+  .agentation-popup.auto {
+    --agentation-bg: #ffffff;
+    --agentation-text: #1f2937;
+    --agentation-hover: #f3f4f6;
+    --agentation-border: #d1d5db;
+  }
+}
+
+/* Animation: Entrance */
+@keyframes agentation-scale-in {
+  from {
+    transform: scale(0.8);
+    opacity: 0;
+  }
+  to {
+    transform: scale(1);
+    opacity: 1;
+  }
+}
+
+.agentation-toolbar {
+  animation: agentation-scale-in 0.2s ease-out;
+}
+
+.agentation-marker {
+  animation: agentation-scale-in 0.15s ease-out;
+}
+
+/* Animation: Popup shake */
+@keyframes agentation-shake {
+  0%, 100% { transform: translateX(0); }
+  25% { transform: translateX(-4px); }
+  75% { transform: translateX(4px); }
+}
+
+.agentation-popup.shake {
+  animation: agentation-shake 0.3s ease-in-out;
+}
+
+/* Block interactions mode */
+body.agentation-blocking * {
+  cursor: crosshair !important;
+}
+
+body.agentation-blocking .agentation-toolbar,
+body.agentation-blocking .agentation-toolbar *,
+body.agentation-blocking .agentation-popup,
+body.agentation-blocking .agentation-popup *,
+body.agentation-blocking .agentation-marker {
+  cursor: default !important;
+}
+`;function O(){if(document.getElementById("agentation-styles"))return;let e=document.createElement("style");e.id="agentation-styles",e.textContent=I,document.head.appendChild(e)}var E=class{generate(t){let n=t.getAttribute("data-testid")||t.getAttribute("data-element");if(n)return`[data-testid="${n}"]`;if(t.id&&this.isUnique(`#${CSS.escape(t.id)}`))return`#${CSS.escape(t.id)}`;let o=t.getAttribute("aria-label");if(o&&this.isUnique(`[aria-label="${o}"]`))return`[aria-label="${CSS.escape(o)}"]`;let i=this.findUniqueClasses(t);return i||this.buildPath(t)}isUnique(t){try{return document.querySelectorAll(t).length===1}catch{return!1}}findUniqueClasses(t){let n=this.getCleanClasses(t);if(n.length===0)return null;for(let a of n){let r=`.${CSS.escape(a)}`;if(this.isUnique(r))return r}for(let a=2;a<=Math.min(3,n.length);a++){let r=n.slice(0,a).map(l=>`.${CSS.escape(l)}`).join("");if(this.isUnique(r))return r}let o=t.tagName.toLowerCase();for(let a of n.slice(0,2)){let r=`${o}.${CSS.escape(a)}`;if(this.isUnique(r))return r}let i=t.parentElement;if(i){let a=this.getSimpleSelector(i);if(a){let r=n.slice(0,2).map(s=>`.${CSS.escape(s)}`).join(""),l=`${a} > ${o}${r}`;if(this.isUnique(l))return l}}return null}getCleanClasses(t){return Array.from(t.classList).filter(n=>!(n.length<=2||/^_[a-z0-9]+$/i.test(n)||/_[a-f0-9]{5,}$/i.test(n)))}getSimpleSelector(t){if(t.id)return`#${CSS.escape(t.id)}`;let n=this.getCleanClasses(t);return n.length>0?`${t.tagName.toLowerCase()}.${CSS.escape(n[0])}`:null}buildPath(t,n=4){let o=[],i=t,a=0;for(;i&&i!==document.body&&a<n;){let r=i.tagName.toLowerCase(),l=this.getCleanClasses(i);l.length>0&&(r+=`.${CSS.escape(l[0])}`);let s=i.parentElement;if(s){let x=Array.from(s.children).filter(f=>f.tagName===i.tagName);if(x.length>1){let f=x.indexOf(i)+1;r+=`:nth-of-type(${f})`}}o.unshift(r),i=i.parentElement,a++}return o.join(" > ")}getFullPath(t){let n=[],o=t;for(;o&&o!==document.documentElement;){let i=o.tagName.toLowerCase();if(o.id)i+=`#${CSS.escape(o.id)}`;else{let a=this.getCleanClasses(o);a.length>0&&(i+=`.${CSS.escape(a[0])}`)}n.unshift(i),o=o.parentElement}return n.unshift("html"),n.join(" > ")}};var S=new E;function y(e){let t=e.tagName.toLowerCase(),n=e.getAttribute("data-element");if(n)return n;if(e instanceof SVGElement||t==="svg"){let a=e.closest('button, a, [role="button"]');return a?`icon in ${y(a)}`:"graphic"}let o=ct(e);if(t==="button"||e.getAttribute("role")==="button")return o?`button "${p(o,25)}"`:"button";if(t==="a"){if(o)return`link "${p(o,25)}"`;let a=e.getAttribute("href");return a?`link to "${p(a,30)}"`:"link"}if(t==="input"){let a=e.getAttribute("type")||"text",r=e.getAttribute("placeholder"),l=e.getAttribute("name");return`input "${p(r||l||a,20)}"`}if(t==="textarea"){let a=e.getAttribute("placeholder"),r=e.getAttribute("name");return`textarea "${p(a||r||"",20)}"`}if(t==="select"){let a=e.getAttribute("name");return a?`select "${p(a,20)}"`:"select"}if(t==="img"){let a=e.getAttribute("alt");return a?`image "${p(a,25)}"`:"image"}if(/^h[1-6]$/.test(t))return o?`${t} "${p(o,35)}"`:t;if(t==="p")return o?`paragraph: "${p(o,40)}..."`:"paragraph";if(t==="label")return o?`label "${p(o,25)}"`:"label";if(["section","article","nav","header","footer","main","aside"].includes(t)){let a=e.getAttribute("aria-label");return a?`${t} "${p(a,25)}"`:t}if(t==="div"||t==="span"){let a=S.getCleanClasses(e);return a.length>0?`${t}.${a[0]}`:t}let i=S.getCleanClasses(e);return i.length>0?`${t}.${i[0]}`:t}function ct(e){let t="";for(let n of e.childNodes)n.nodeType===Node.TEXT_NODE&&(t+=n.textContent);return t=t.trim(),!t&&e.childElementCount===0&&(t=e.textContent?.trim()||""),t}function p(e,t){return e?(e=e.trim().replace(/\s+/g," "),e.length<=t?e:e.slice(0,t-3)+"..."):""}function D(e){return S.getCleanClasses(e)}function H(e){return S.generate(e)}function V(e){return S.getFullPath(e)}function q(e){let t=[],n=e.textContent?.trim();n&&n.length<100&&t.push(n);let o=e.previousElementSibling;if(o){let a=o.textContent?.trim();a&&a.length<50&&t.unshift(a)}let i=e.nextElementSibling;if(i){let a=i.textContent?.trim();a&&a.length<50&&t.push(a)}return t.join(" | ")}function U(e){let t=e.parentElement;if(!t)return"";let n=Array.from(t.children).filter(o=>o!==e).slice(0,4).map(o=>y(o));return n.length===0?"":n.join(", ")}function _(e){let t=[],n=e.getAttribute("role");n&&t.push(`role="${n}"`);let o=e.getAttribute("aria-label");o&&t.push(`aria-label="${o}"`);let i=e.getAttribute("aria-describedby");i&&t.push(`aria-describedby="${i}"`);let a=e.getAttribute("tabindex");a!==null&&t.push(`tabindex="${a}"`);let r=e.getAttribute("aria-hidden");return r&&t.push(`aria-hidden="${r}"`),e.matches('a[href], button, input, select, textarea, [tabindex]:not([tabindex="-1"])')&&t.push("focusable"),t.join(", ")}function K(e){let t=window.getComputedStyle(e),n={};return n.color=t.color,n.backgroundColor=t.backgroundColor,n.fontSize=t.fontSize,n.fontWeight=t.fontWeight,n.fontFamily=t.fontFamily,n.display=t.display,n.position=t.position,n.padding=t.padding,n.margin=t.margin,n}function R(e){let t=e;for(;t&&t!==document.body;){let n=window.getComputedStyle(t).position;if(n==="fixed"||n==="sticky")return!0;t=t.parentElement}return!1}var ut="agentation-annotations-";function L(){return ut+window.location.pathname}function X(){try{let e=L(),t=localStorage.getItem(e);if(!t)return[];let n=JSON.parse(t),o=Date.now(),i=7*24*60*60*1e3,a=n.filter(r=>r.timestamp&&o-r.timestamp<i);return a.length!==n.length&&T(a),a}catch(e){return console.warn("Agentation: Failed to load annotations",e),[]}}function T(e){try{let t=L();e.length===0?localStorage.removeItem(t):localStorage.setItem(t,JSON.stringify(e))}catch(t){console.warn("Agentation: Failed to save annotations",t)}}function W(){try{let e=L();localStorage.removeItem(e)}catch(e){console.warn("Agentation: Failed to clear annotations",e)}}function Y(){try{let e=localStorage.getItem("agentation-settings");return e?JSON.parse(e):{}}catch{return{}}}function J(e){try{localStorage.setItem("agentation-settings",JSON.stringify(e))}catch(t){console.warn("Agentation: Failed to save settings",t)}}var m=[],G=0;function Q(){m=X(),G=m.reduce((e,t)=>{let n=parseInt(t.id.split("-")[1]||"0",10);return Math.max(e,n)},0)+1}function Z(e,t,n="",o=!1){let i=e.getBoundingClientRect(),a=window.scrollY,r=window.scrollX,l=R(e),s={id:`ann-${G++}`,timestamp:Date.now(),x:(i.left+i.width/2)/window.innerWidth*100,y:l?i.top+i.height/2:i.top+i.height/2+a,element:y(e),elementPath:H(e),comment:t,selectedText:n?n.slice(0,500):void 0,boundingBox:{x:Math.round(i.left+r),y:Math.round(i.top+a),width:Math.round(i.width),height:Math.round(i.height)},cssClasses:D(e).join(" ")||void 0,nearbyText:q(e)||void 0,nearbyElements:U(e)||void 0,fullPath:V(e),accessibility:_(e)||void 0,computedStyles:dt(K(e)),isMultiSelect:o||void 0,isFixed:l||void 0};return m.push(s),T(m),s}function dt(e){return Object.entries(e).filter(([,t])=>t&&t!=="none"&&t!=="normal"&&t!=="auto").map(([t,n])=>`${t}: ${n}`).join("; ")}function M(){return[...m]}function j(){m=[],W()}function tt(){return m.length}function et(e,t,n,o,i={}){let{theme:a="dark",accentColor:r="#3b82f6"}=i;v();let l=e.getBoundingClientRect(),s=document.createElement("div");s.className=`agentation-popup ${a}`,s.style.setProperty("--agentation-accent",r);let x=l.bottom+8,f=l.left;x+150>window.innerHeight&&(x=l.top-150-8),f+324>window.innerWidth&&(f=window.innerWidth-324-16),f<16&&(f=16),s.style.top=`${x}px`,s.style.left=`${f}px`,s.innerHTML=`
+    <div class="agentation-popup-header">
+      Annotating: ${pt(t)}
+    </div>
+    <textarea
+      class="agentation-popup-input"
+      placeholder="What's the issue with this element?"
+      autofocus
+    ></textarea>
+    <div class="agentation-popup-hint">
+      Enter to save \xB7 Shift+Enter for new line \xB7 Escape to cancel
+    </div>
+  `,document.body.appendChild(s);let w=s.querySelector("textarea");w.focus();let B=h=>{if(h.key==="Enter"&&!h.shiftKey){h.preventDefault();let rt=w.value.trim();v(),n(rt)}else h.key==="Escape"&&(h.preventDefault(),v(),o())};w.addEventListener("keydown",B);let F=h=>{s.contains(h.target)||(w.value.trim()?(s.classList.add("shake"),setTimeout(()=>s.classList.remove("shake"),300)):(v(),o()))};setTimeout(()=>{document.addEventListener("mousedown",F)},100),s._cleanup=()=>{w.removeEventListener("keydown",B),document.removeEventListener("mousedown",F)}}function v(){let e=document.querySelector(".agentation-popup");e&&(e._cleanup&&e._cleanup(),e.remove())}function N(){return!!document.querySelector(".agentation-popup")}function pt(e){let t=document.createElement("div");return t.textContent=e,t.innerHTML}var ot=new Map,nt=!1;function gt(e){let t=e.toLowerCase().split("+");return{key:t[t.length-1],ctrl:t.includes("ctrl"),shift:t.includes("shift"),alt:t.includes("alt"),meta:t.includes("meta")||t.includes("cmd")}}function ft(e,t){let n=gt(t),o=e.key.toLowerCase()===n.key,i=e.ctrlKey===n.ctrl,a=e.shiftKey===n.shift,r=e.altKey===n.alt,l=e.metaKey===n.meta;return o&&i&&a&&r&&l}function ht(e){for(let[t,n]of ot)if(ft(e,t)){e.preventDefault(),e.stopPropagation(),n();return}}function mt(){nt||(document.addEventListener("keydown",ht,!0),nt=!0)}function at(e,t){mt(),ot.set(e.toLowerCase(),t)}var d=null,k=null,A=!1,C=!0,u=null,c={},z={};function Kt(e={},{expanded:t=!1,active:n=!1}={}){z=e,C=!t,c={detail:e.defaultDetail||"standard",format:e.defaultFormat||"markdown",theme:e.theme||"auto",accentColor:e.accentColor||"#3b82f6",blockInteractions:e.blockInteractions!==!1,autoClearOnCopy:e.autoClearOnCopy||!1,markersVisible:!0,...Y()},O(),Q(),bt(),xt(),yt(),$();let o=e.keyboardShortcut||"ctrl+shift+a";at(o,it),n&&P(!0)}function bt(){d=document.createElement("div"),d.className=`agentation-toolbar ${C?"collapsed ":""}${c.theme}`,d.style.setProperty("--agentation-accent",c.accentColor);let e=z.position||"bottom-right",[t,n]=e.split("-");d.style[t]="16px",d.style[n]="16px",b(),document.body.appendChild(d)}function b(){let e=tt();d.innerHTML=`
+    <div class="agentation-toolbar-inner">
+      ${C?`
+        <div class="agentation-badge">
+          ${g.logo}
+          ${e>0?`<span class="agentation-badge-count">${e}</span>`:""}
+        </div>
+      `:`
+        <button class="agentation-btn" data-action="toggle" title="Toggle annotation mode">
+          ${g.logo}
+        </button>
+        <div class="agentation-divider"></div>
+        <div class="agentation-controls">
+          <button class="agentation-btn ${c.markersVisible?"":"active"}" data-action="visibility" title="Toggle markers">
+            ${c.markersVisible?g.eye:g.eyeOff}
+          </button>
+          <button class="agentation-btn" data-action="copy" title="Copy to clipboard">
+            ${g.copy}
+          </button>
+          <button class="agentation-btn" data-action="clear" title="Clear annotations">
+            ${g.trash}
+          </button>
+          <span class="agentation-count">${e}</span>
+          <div class="agentation-divider"></div>
+          <button class="agentation-btn" data-action="close" title="Close">
+            ${g.close}
+          </button>
+        </div>
+      `}
+    </div>
+  `}function xt(){let e=document.createElement("div");e.className="agentation-markers-fixed",document.body.appendChild(e);let t=document.createElement("div");t.className="agentation-markers-scroll",document.body.appendChild(t),k={fixed:e,scroll:t}}function $(){if(!k||(k.fixed.innerHTML="",k.scroll.innerHTML="",!c.markersVisible))return;M().forEach((t,n)=>{let o=document.createElement("div");o.className=`agentation-marker ${t.isMultiSelect?"multi-select":""}`,o.style.setProperty("--agentation-accent",c.accentColor),o.textContent=n+1,o.dataset.id=t.id,o.title=t.comment||t.element,t.isFixed?(o.style.left=`${t.x}%`,o.style.top=`${t.y}px`,k.fixed.appendChild(o)):(o.style.left=`${t.x}%`,o.style.top=`${t.y}px`,k.scroll.appendChild(o))})}function yt(){d.addEventListener("click",vt),document.addEventListener("click",Ct,!0),document.addEventListener("mouseover",wt),document.addEventListener("mouseout",St)}function vt(e){let t=e.target.closest("[data-action]");if(C){C=!1,d.classList.remove("collapsed"),b();return}if(!t)return;switch(t.dataset.action){case"toggle":it();break;case"visibility":c.markersVisible=!c.markersVisible,J(c),b(),$();break;case"copy":kt(t);break;case"clear":j(),b(),$();break;case"close":C=!0,d.classList.add("collapsed"),P(!1),b();break}}async function kt(e){let t=M();if(t.length===0)return;let{formatOutput:n,copyToClipboard:o}=await import("./output-formatter-IVPJ3JTL.js"),i=n(t,{detail:c.detail,format:c.format,route:z.route});await o(i)&&(e.innerHTML=g.check,e.classList.add("active"),setTimeout(()=>{e.innerHTML=g.copy,e.classList.remove("active")},1500),c.autoClearOnCopy&&(j(),b(),$()))}function Ct(e){if(!A||d.contains(e.target)||e.target.closest(".agentation-popup")||e.target.closest(".agentation-marker")||(c.blockInteractions&&(e.preventDefault(),e.stopPropagation()),N()))return;let t=e.target,n=y(t),o=window.getSelection()?.toString()?.trim()||"";u&&(u.removeAttribute("data-agentation-highlight"),u=null),et(t,n,i=>{Z(t,i,o),b(),$()},()=>{},{theme:c.theme,accentColor:c.accentColor})}function wt(e){A&&(d.contains(e.target)||e.target.closest(".agentation-popup")||e.target.closest(".agentation-marker")||N()||(u&&u.removeAttribute("data-agentation-highlight"),u=e.target,u.setAttribute("data-agentation-highlight","")))}function St(e){A&&u&&!u.contains(e.relatedTarget)&&(u.removeAttribute("data-agentation-highlight"),u=null)}function it(){P(!A)}function P(e){A=e,e?c.blockInteractions&&document.body.classList.add("agentation-blocking"):(document.body.classList.remove("agentation-blocking"),u&&(u.removeAttribute("data-agentation-highlight"),u=null),v());let t=d.querySelector('[data-action="toggle"]');t&&t.classList.toggle("active",e)}export{Kt as initToolbar};
@@ -0,0 +1,98 @@
+/**
+ * Agentation bootstrap - the only code injected into every page.
+ * Shows the collapsed badge and loads the toolbar chunk on first use.
+ * @version 0.1.0
+ */
+
+import { logo } from './icons.js';
+import { matchesShortcut } from './keyboard.js';
+import { loadAnnotations } from './storage.js';
+import LAUNCHER_STYLES from './launcher.css';
+
+(function() {
+  'use strict';
+
+  // Get config injected by Python (a JSON data block in CSP mode)
+  const configBlock = document.getElementById('agentation-config');
+  const config = window.__AGENTATION_CONFIG__
+    || (configBlock ? JSON.parse(configBlock.textContent) : {});
+  const chunks = config.chunks || {};
+  const shortcut = config.keyboardShortcut || 'ctrl+shift+a';
+
+  let launcher = null;
+  let loading = null;
+
+  /**
+   * Load the toolbar chunk and hand over to it.
+   * @param {Object} options - Initial toolbar state, see initToolbar
+   */
+  function loadToolbar(options) {
+    if (!loading) {
+      // The toolbar registers its own shortcut once loaded
+      document.removeEventListener('keydown', handleKeydown, true);
+      loading = import(chunks.toolbar).then((module) => {
+        if (launcher) {
+          launcher.remove();
+          launcher = null;
+        }
+        module.initToolbar(config, options);
+      });
+    }
+    return loading;
+  }
+
+  /**
+   * Load the toolbar in annotation mode when the shortcut is pressed.
+   */
+  function handleKeydown(event) {
+    if (matchesShortcut(event, shortcut)) {
+      event.preventDefault();
+      event.stopPropagation();
+      loadToolbar({ active: true });
+    }
+  }
+
+  /**
+   * Render the collapsed badge.
+   */
+  function createLauncher() {
+    const style = document.createElement('style');
+    style.id = 'agentation-launcher-styles';
+    style.textContent = LAUNCHER_STYLES;
+    document.head.appendChild(style);
+
+    launcher = document.createElement('button');
+    launcher.type = 'button';
+    launcher.className = `agentation-launcher ${config.theme || 'auto'}`;
+    launcher.title = 'Agentation';
+    launcher.innerHTML = logo;
+
+    const [vertical, horizontal] = (config.position || 'bottom-right').split('-');
+    launcher.style[vertical] = '16px';
+    launcher.style[horizontal] = '16px';
+
+    launcher.addEventListener('click', () => loadToolbar({ expanded: true }));
+    document.body.appendChild(launcher);
+  }
+
+  function init() {
+    // Saved annotations need their markers drawn, so load the toolbar straight away
+    if (loadAnnotations().length > 0) {
+      loadToolbar({});
+      return;
+    }
+
+    createLauncher();
+    document.addEventListener('keydown', handleKeydown, true);
+  }
+
+  // Initialize when DOM is ready
+  if (document.readyState === 'loading') {
+    document.addEventListener('DOMContentLoaded', init);
+  } else {
+    init();
+  }
+
+  // Mark as loaded
+  window.__AGENTATION_LOADED__ = true;
+})();
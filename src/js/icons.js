@@ -2,13 +2,15 @@
  * SVG icons for Agentation toolbar.
  */
 
-export const icons = {
-  // Agentation logo/badge
-  logo: `<svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round">
+// Agentation logo/badge (exported on its own so the bootstrap can use it)
+export const logo = `<svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round">
     <circle cx="12" cy="12" r="10"/>
     <path d="M12 16v-4"/>
     <path d="M12 8h.01"/>
-  </svg>`,
+  </svg>`;
+
+export const icons = {
+  logo,
 
   // Pause animations
   pause: `<svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round">
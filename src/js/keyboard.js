@@ -23,8 +23,11 @@ function parseShortcut(shortcut) {
 
 /**
  * Check if event matches shortcut.
+ * @param {KeyboardEvent} event
+ * @param {string} shortcut - e.g., "ctrl+shift+a"
+ * @returns {boolean}
  */
-function matchesShortcut(event, shortcut) {
+export function matchesShortcut(event, shortcut) {
   const parsed = parseShortcut(shortcut);
 
   const keyMatches = event.key.toLowerCase() === parsed.key;
@@ -11,7 +11,6 @@ import {
   clearAllAnnotations,
   getAnnotationCount,
 } from './annotations.js';
-import { formatOutput, copyToClipboard } from './output-formatter.js';
 import { showPopup, hidePopup, isPopupVisible } from './popup.js';
 import { registerShortcut } from './keyboard.js';
 import { identifyElement } from './element-identification.js';
@@ -28,9 +27,12 @@ let config = {};
 /**
  * Initialize Agentation toolbar.
  * @param {Object} cfg - Configuration from Python
+ * @param {Object} options - { expanded, active } state to start in, set by the bootstrap
+ *   when the toolbar is loaded in response to a click or the keyboard shortcut
  */
-export function initToolbar(cfg = {}) {
+export function initToolbar(cfg = {}, { expanded = false, active = false } = {}) {
   config = cfg;
+  isCollapsed = !expanded;
 
   // Load persisted settings
   settings = {
@@ -54,6 +56,10 @@ export function initToolbar(cfg = {}) {
   // Register keyboard shortcut
   const shortcut = cfg.keyboardShortcut || 'ctrl+shift+a';
   registerShortcut(shortcut, toggleActive);
+
+  if (active) {
+    setActive(true);
+  }
 }
 
 /**
@@ -61,7 +67,7 @@ export function initToolbar(cfg = {}) {
  */
 function createToolbar() {
   toolbar = document.createElement('div');
-  toolbar.className = `agentation-toolbar collapsed ${settings.theme}`;
+  toolbar.className = `agentation-toolbar ${isCollapsed ? 'collapsed ' : ''}${settings.theme}`;
   toolbar.style.setProperty('--agentation-accent', settings.accentColor);
 
   // Position
@@ -229,6 +235,9 @@ async function handleCopy(btn) {
   const annotations = getAnnotations();
   if (annotations.length === 0) return;
 
+  // Loaded on first copy; most sessions never need the formatter
+  const { formatOutput, copyToClipboard } = await import('./output-formatter.js');
+
   const output = formatOutput(annotations, {
     detail: settings.detail,
     format: settings.format,
@@ -1,7 +1,56 @@
 """Pytest configuration."""
 
+import asyncio
+import os
 import sys
 from pathlib import Path
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+
+def run_asgi(app, extensions, sent, accept=b"text/html", path="/"):
+    """
+    Drive the app like an in-process ASGI server that advertises ``extensions``.
+
+    Every message the app sends is appended to ``sent``. Returns the (body, headers)
+    pair the server would have written, including the contents of any file sent
+    through the pathsend or zerocopysend extensions.
+    """
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"testserver"), (b"accept", accept)],
+        "server": ("testserver", 80),
+        "client": ("testclient", 1234),
+        "extensions": extensions,
+    }
+    headers = {}
+    body = bytearray()
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        sent.append(message)
+        # Files are read as the message arrives; the app closes them once it is sent
+        if message["type"] == "http.response.start":
+            headers.update((k.decode(), v.decode()) for k, v in message["headers"])
+        elif message["type"] == "http.response.body":
+            body.extend(message.get("body", b""))
+        elif message["type"] == "http.response.zerocopysend":
+            fd = message["file"].fileno()
+            body.extend(os.pread(fd, message["count"], message["offset"]))
+        elif message["type"] == "http.response.pathsend":
+            with open(message["path"], "rb") as f:
+                body.extend(f.read())
+
+    asyncio.run(app(scope, receive, send))
+    return bytes(body), headers
@@ -1,6 +1,24 @@
 """Tests for asset loading."""
 
-from agentation.assets import get_js_content
+import base64
+import hashlib
+from pathlib import Path
+
+from agentation.assets import (
+    ASSET_PREFIX,
+    CHUNK_PREFIX,
+    get_asset_content,
+    get_bundle_path,
+    get_chunk_content,
+    get_chunk_manifest,
+    get_chunk_urls,
+    get_chunks_digest,
+    get_js_content,
+    get_preload_link,
+    get_style_hashes,
+)
+
+JS_SOURCE_DIR = Path(__file__).parent.parent / "src" / "js"
 
 
 def test_get_js_content_returns_string():
@@ -14,3 +32,85 @@ def test_get_js_content_contains_agentation():
     """JS content contains Agentation marker."""
     content = get_js_content()
     assert "Agentation" in content or "agentation" in content.lower()
+
+
+def test_get_bundle_path_is_content_hashed():
+    """Bootstrap URL changes whenever the bootstrap content does."""
+    path = get_bundle_path()
+    digest = hashlib.sha256(get_js_content().encode("utf-8")).hexdigest()[:12]
+    assert path == f"{ASSET_PREFIX}/bootstrap.{digest}.min.js"
+
+
+def test_get_preload_link():
+    """Preload link points at the bundle as a script."""
+    assert get_preload_link() == f"<{get_bundle_path()}>; rel=preload; as=script"
+
+
+def test_chunk_manifest_lists_toolbar_entry():
+    """The manifest names the toolbar entry and it is a servable file."""
+    manifest = get_chunk_manifest()
+    assert manifest["entries"]["toolbar"] in manifest["files"]
+
+
+def test_get_style_hashes_match_stylesheets():
+    """The manifest hashes the stylesheets the JS build inlines into the bundles."""
+    expected = sorted(
+        "sha384-" + base64.b64encode(hashlib.sha384(path.read_bytes()).digest()).decode()
+        for path in JS_SOURCE_DIR.glob("*.css")
+    )
+    assert list(get_style_hashes()) == expected
+
+
+def test_get_chunk_urls():
+    """Entry URLs live under the chunk prefix, in a directory named by content hash."""
+    toolbar_file = get_chunk_manifest()["entries"]["toolbar"]
+    assert get_chunk_urls() == {
+        "toolbar": f"{CHUNK_PREFIX}{get_chunks_digest()}/{toolbar_file}"
+    }
+
+
+def test_get_chunks_digest_follows_content(monkeypatch):
+    """Changing a chunk without renaming it still changes the chunk URLs."""
+    digest = get_chunks_digest()
+    toolbar_file = get_chunk_manifest()["entries"]["toolbar"]
+    edited = {name: get_chunk_content(name) for name in get_chunk_manifest()["files"]}
+    edited[toolbar_file] += "\n// edited"
+    monkeypatch.setattr("agentation.assets._read_chunk", edited.__getitem__)
+    get_chunks_digest.cache_clear()
+    try:
+        assert get_chunks_digest() != digest
+    finally:
+        get_chunks_digest.cache_clear()
+
+
+def test_get_chunk_content_serves_manifest_files():
+    """Every file in the manifest can be loaded."""
+    for file_name in get_chunk_manifest()["files"]:
+        content = get_chunk_content(file_name)
+        assert content
+
+
+def test_get_chunk_content_rejects_unknown_files():
+    """Names outside the manifest, including traversal attempts, are not served."""
+    assert get_chunk_content("missing.js") is None
+    assert get_chunk_content("manifest.json") is None
+    assert get_chunk_content("../bootstrap.min.js") is None
+
+
+def test_get_asset_content():
+    """Asset URLs resolve to the bootstrap or a chunk."""
+    toolbar_url = get_chunk_urls()["toolbar"]
+    toolbar_file = get_chunk_manifest()["entries"]["toolbar"]
+    assert get_asset_content(get_bundle_path()) == get_js_content()
+    assert get_asset_content(toolbar_url) == get_chunk_content(toolbar_file)
+    assert get_asset_content(f"{ASSET_PREFIX}/other.js") is None
+    # Unhashed or stale chunk URLs are not served
+    assert get_asset_content(CHUNK_PREFIX + toolbar_file) is None
+    assert get_asset_content(f"{CHUNK_PREFIX}000000000000/{toolbar_file}") is None
+
+
+def test_bootstrap_is_smaller_than_toolbar():
+    """Only the small bootstrap is injected; the toolbar is loaded on demand."""
+    toolbar = get_chunk_content(get_chunk_manifest()["entries"]["toolbar"])
+    assert toolbar is not None
+    assert len(get_js_content()) < len(toolbar) / 4
@@ -16,6 +16,8 @@ def test_config_defaults():
     assert config.block_interactions is True
     assert config.auto_clear_on_copy is False
     assert config.include_route is True
+    assert config.preload is False
+    assert config.csp is False
 
 
 def test_config_custom_values():
@@ -89,3 +91,10 @@ def test_is_enabled_explicit_overrides_env(monkeypatch):
     monkeypatch.setenv("AGENTATION_ENABLED", "true")
     config = AgentationConfig(enabled=False)
     assert is_enabled(config) is False
+
+
+def test_config_to_dict_omits_server_side_options():
+    """Server-side delivery options are not sent to the toolbar."""
+    config = AgentationConfig(preload=True, csp=True)
+    assert "preload" not in config.to_dict()
+    assert "csp" not in config.to_dict()
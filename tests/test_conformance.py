@@ -0,0 +1,379 @@
+"""Conformance tests: every injection code path must match inject_agentation byte for byte.
+
+Each code path takes the response body as a list of byte chunks and returns the
+(body, headers) pair a client would see. The expected body is always the reference
+``inject_agentation`` applied to the decoded document, and the headers the adapter
+adds (the preload Link, the amended policy) must appear exactly when it injected, so a
+new fast path only needs to be added to ``CODE_PATHS`` to be held to the same contract.
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import tempfile
+from collections.abc import AsyncIterator, Callable, Iterator
+from dataclasses import dataclass, field
+
+import pytest
+from conftest import run_asgi
+from flask import Flask, request, send_file
+from starlette.applications import Starlette
+from starlette.responses import FileResponse, HTMLResponse, StreamingResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from agentation import AgentationConfig
+from agentation.adapters.fastapi import AgentationMiddleware
+from agentation.adapters.flask import AgentationFlask
+from agentation.assets import get_preload_link, get_script_hash
+from agentation.csp import get_csp_style_sources
+from agentation.injector import inject_agentation
+
+CONFIG = AgentationConfig(enabled=True)
+PRELOAD_CONFIG = AgentationConfig(enabled=True, preload=True)
+CSP_CONFIG = AgentationConfig(enabled=True, csp=True)
+CSP_PRELOAD_CONFIG = AgentationConfig(enabled=True, csp=True, preload=True)
+
+# Fragments that exercise the tag search: decoys, mixed case, multibyte text and
+# characters whose str.lower() changes length ("İ" lowers to two code points).
+FRAGMENTS = [
+    "<p>plain text</p>",
+    "<div class='x'>héllo wörld</div>",
+    "日本語のテキスト",
+    "emoji 🙂🚀 here",
+    "İstanbul",
+    "ẞ straße",
+    "</bod",
+    "</ body>",
+    "</body",
+    "<body>",
+    "<BODY data-x='1'>",
+    "<!-- </body> in a comment -->",
+    "<script>var s = '</body>';</script>",
+    "\n",
+    "\t  ",
+]
+
+BODY_CLOSE_VARIANTS = ["</body>", "</BODY>", "</Body>", "</bOdY>", "</boDY>"]
+
+
+def generate_documents(seed: int, count: int) -> list[str]:
+    """Generate adversarial HTML documents deterministically from ``seed``."""
+    rng = random.Random(seed)
+    documents: list[str] = []
+    for _ in range(count):
+        parts: list[str] = []
+        for _ in range(rng.randint(0, 12)):
+            if rng.random() < 0.2:
+                parts.append(rng.choice(BODY_CLOSE_VARIANTS))
+            else:
+                parts.append(rng.choice(FRAGMENTS))
+        documents.append("".join(parts))
+    return documents
+
+
+FIXED_DOCUMENTS = [
+    "",
+    "<html><body><h1>Hello</h1></body></html>",
+    "<html><BODY><h1>Hello</h1></BODY></html>",
+    "<html><body>first</body><body>second</body></html>",
+    "<html><body>İİİ</body></html>",
+    "<html><body>🙂</body></html>",
+    "<html><head></head></html>",
+    "</body>",
+    "</body></body></body>",
+]
+
+DOCUMENTS = FIXED_DOCUMENTS + generate_documents(seed=20240101, count=60)
+
+# Documents used for the exhaustive chunk-boundary checks; the tag sits next to
+# multibyte characters so splits land both inside the tag and inside a character.
+SPLIT_DOCUMENTS = [
+    "<html><body>日本</body></html>",
+    "<p>🙂</BODY>İ</body>",
+]
+
+
+NONCE = "r4nd0m"
+STYLE_SOURCES = " ".join(get_csp_style_sources())
+
+# The policy Talisman sends by default, and one that also allows scripts by nonce
+POLICY = {"Content-Security-Policy": "default-src 'self'"}
+NONCE_POLICY = {"Content-Security-Policy": f"default-src 'self'; script-src 'self' 'nonce-{NONCE}'"}
+
+
+def amended_policy(origin: str, script_source: str) -> dict[str, str]:
+    """The policy headers above, as they should read once the toolbar is injected."""
+    return {
+        "content-security-policy": (
+            f"default-src 'self'; script-src 'self' {script_source} "
+            f"{origin}/__agentation__/; style-src 'self' {STYLE_SOURCES}"
+        )
+    }
+
+
+@dataclass(frozen=True)
+class CodePath:
+    """A way of serving HTML with Agentation injected."""
+
+    name: str
+    # Route string the adapter passes to inject_agentation
+    route: str
+    serve: Callable[[CodePath, list[bytes]], tuple[bytes, dict[str, str]]]
+    config: AgentationConfig = field(default_factory=lambda: CONFIG)
+    # CSP nonce the page sets on the request
+    nonce: str | None = None
+    # Headers the page is served with
+    page_headers: dict[str, str] = field(default_factory=dict)
+    # Headers a client must see once the document was injected into; without an
+    # injection they must match page_headers (or be absent)
+    headers: dict[str, str] = field(default_factory=dict)
+
+
+def _serve_starlette(streaming: bool) -> Callable[[CodePath, list[bytes]], tuple[bytes, dict]]:
+    def serve(path: CodePath, chunks: list[bytes]) -> tuple[bytes, dict[str, str]]:
+        async def page(request):
+            if path.nonce:
+                request.state.csp_nonce = path.nonce
+            if streaming:
+
+                async def body() -> AsyncIterator[bytes]:
+                    for chunk in chunks:
+                        yield chunk
+
+                return StreamingResponse(
+                    body(), media_type="text/html", headers=path.page_headers
+                )
+            return HTMLResponse(b"".join(chunks), headers=path.page_headers)
+
+        app = Starlette(routes=[Route("/page", page)])
+        app.add_middleware(AgentationMiddleware, config=path.config)
+        response = TestClient(app).get("/page")
+        return response.content, dict(response.headers)
+
+    return serve
+
+
+def _serve_flask(streaming: bool) -> Callable[[CodePath, list[bytes]], tuple[bytes, dict]]:
+    def serve(path: CodePath, chunks: list[bytes]) -> tuple[bytes, dict[str, str]]:
+        app = Flask(__name__)
+
+        @app.route("/page")
+        def page():
+            if path.nonce:
+                request.csp_nonce = path.nonce
+            body = iter(chunks) if streaming else b"".join(chunks)
+            return app.response_class(body, mimetype="text/html", headers=path.page_headers)
+
+        AgentationFlask(app, config=path.config)
+        response = app.test_client().get("/page")
+        return response.get_data(), {k.lower(): v for k, v in response.headers.items()}
+
+    return serve
+
+
+def _write_html_file(chunks: list[bytes]) -> str:
+    with tempfile.NamedTemporaryFile(suffix=".html", delete=False) as f:
+        for chunk in chunks:
+            f.write(chunk)
+    return f.name
+
+
+def _create_starlette_file_app(path: CodePath, file_path: str) -> Starlette:
+    async def page(request):
+        if path.nonce:
+            request.state.csp_nonce = path.nonce
+        return FileResponse(file_path, headers=path.page_headers)
+
+    app = Starlette(routes=[Route("/page", page)])
+    app.add_middleware(AgentationMiddleware, config=path.config)
+    return app
+
+
+def _serve_starlette_file(path: CodePath, chunks: list[bytes]) -> tuple[bytes, dict[str, str]]:
+    file_path = _write_html_file(chunks)
+    try:
+        response = TestClient(_create_starlette_file_app(path, file_path)).get("/page")
+        return response.content, dict(response.headers)
+    finally:
+        os.unlink(file_path)
+
+
+def _serve_asgi_stub(extensions: dict[str, dict]) -> Callable:
+    """Serve a FileResponse through an in-process ASGI server with ``extensions``."""
+
+    def serve(path: CodePath, chunks: list[bytes]) -> tuple[bytes, dict[str, str]]:
+        file_path = _write_html_file(chunks)
+        try:
+            app = _create_starlette_file_app(path, file_path)
+            return run_asgi(app, extensions, [], path="/page")
+        finally:
+            os.unlink(file_path)
+
+    return serve
+
+
+def _serve_flask_file(path: CodePath, chunks: list[bytes]) -> tuple[bytes, dict[str, str]]:
+    file_path = _write_html_file(chunks)
+    try:
+        app = Flask(__name__)
+
+        @app.route("/page")
+        def page():
+            if path.nonce:
+                request.csp_nonce = path.nonce
+            response = send_file(file_path, mimetype="text/html")
+            response.headers.update(path.page_headers)
+            return response
+
+        AgentationFlask(app, config=path.config)
+        response = app.test_client().get("/page")
+        body = response.get_data()
+        response.close()
+        return body, {k.lower(): v for k, v in response.headers.items()}
+    finally:
+        os.unlink(file_path)
+
+
+ZEROCOPY = {"http.response.pathsend": {}, "http.response.zerocopysend": {}}
+STARLETTE_HASH_POLICY = amended_policy("http://testserver", f"'{get_script_hash()}'")
+STARLETTE_NONCE_POLICY = amended_policy("http://testserver", f"'nonce-{NONCE}'")
+FLASK_HASH_POLICY = amended_policy("http://localhost", f"'{get_script_hash()}'")
+FLASK_NONCE_POLICY = amended_policy("http://localhost", f"'nonce-{NONCE}'")
+PRELOAD_LINK = {"link": get_preload_link()}
+
+CODE_PATHS = [
+    CodePath("starlette", "/page", _serve_starlette(streaming=False)),
+    CodePath("starlette-streaming", "/page", _serve_starlette(streaming=True)),
+    CodePath("flask", "page", _serve_flask(streaming=False)),
+    CodePath("flask-streaming", "page", _serve_flask(streaming=True)),
+    CodePath(
+        "starlette-preload",
+        "/page",
+        _serve_starlette(streaming=True),
+        PRELOAD_CONFIG,
+        headers=PRELOAD_LINK,
+    ),
+    CodePath(
+        "flask-preload", "page", _serve_flask(streaming=True), PRELOAD_CONFIG, headers=PRELOAD_LINK
+    ),
+    CodePath(
+        "starlette-csp",
+        "/page",
+        _serve_starlette(streaming=True),
+        CSP_CONFIG,
+        page_headers=POLICY,
+        headers=STARLETTE_HASH_POLICY,
+    ),
+    CodePath(
+        "starlette-csp-nonce-preload",
+        "/page",
+        _serve_starlette(streaming=True),
+        CSP_PRELOAD_CONFIG,
+        nonce=NONCE,
+        page_headers=NONCE_POLICY,
+        headers={**STARLETTE_NONCE_POLICY, **PRELOAD_LINK},
+    ),
+    CodePath(
+        "flask-csp",
+        "page",
+        _serve_flask(streaming=True),
+        CSP_CONFIG,
+        page_headers=POLICY,
+        headers=FLASK_HASH_POLICY,
+    ),
+    CodePath(
+        "flask-csp-nonce-preload",
+        "page",
+        _serve_flask(streaming=True),
+        CSP_PRELOAD_CONFIG,
+        nonce=NONCE,
+        page_headers=NONCE_POLICY,
+        headers={**FLASK_NONCE_POLICY, **PRELOAD_LINK},
+    ),
+    CodePath("starlette-file", "/page", _serve_starlette_file),
+    CodePath("starlette-file-pathsend", "/page", _serve_asgi_stub({"http.response.pathsend": {}})),
+    CodePath("starlette-file-zerocopy", "/page", _serve_asgi_stub(ZEROCOPY)),
+    CodePath(
+        "starlette-file-zerocopy-csp-nonce",
+        "/page",
+        _serve_asgi_stub(ZEROCOPY),
+        CSP_CONFIG,
+        nonce=NONCE,
+        page_headers=NONCE_POLICY,
+        headers=STARLETTE_NONCE_POLICY,
+    ),
+    CodePath("flask-file", "page", _serve_flask_file),
+    CodePath(
+        "flask-file-csp",
+        "page",
+        _serve_flask_file,
+        CSP_CONFIG,
+        page_headers=POLICY,
+        headers=FLASK_HASH_POLICY,
+    ),
+]
+
+
+def expected_body(path: CodePath, html: str) -> bytes:
+    return inject_agentation(html, path.config, route=path.route, nonce=path.nonce).encode(
+        "utf-8"
+    )
+
+
+def assert_conforms(path: CodePath, html: str, chunks: list[bytes]) -> None:
+    body, headers = path.serve(path, chunks)
+    expected = expected_body(path, html)
+    assert body == expected
+    assert "text/html" in headers["content-type"]
+    if "content-length" in headers:
+        assert int(headers["content-length"]) == len(body)
+
+    page_headers = {k.lower(): v for k, v in path.page_headers.items()}
+    injected = expected != html.encode("utf-8")
+    for name, value in path.headers.items():
+        assert headers.get(name) == (value if injected else page_headers.get(name))
+
+
+def split_points(data: bytes) -> Iterator[list[bytes]]:
+    """Yield two-chunk splits of ``data`` at every byte offset."""
+    for i in range(len(data) + 1):
+        yield [data[:i], data[i:]]
+
+
+@pytest.mark.parametrize("path", CODE_PATHS, ids=lambda p: p.name)
+@pytest.mark.parametrize("html", DOCUMENTS, ids=lambda _: "doc")
+def test_code_path_matches_reference(path: CodePath, html: str):
+    """Every code path produces the reference output for adversarial documents."""
+    assert_conforms(path, html, [html.encode("utf-8")])
+
+
+@pytest.mark.parametrize("path", CODE_PATHS, ids=lambda p: p.name)
+@pytest.mark.parametrize("html", SPLIT_DOCUMENTS, ids=lambda _: "doc")
+def test_code_path_matches_reference_at_every_chunk_boundary(path: CodePath, html: str):
+    """Splitting the body at any byte offset does not change the output."""
+    data = html.encode("utf-8")
+    for chunks in split_points(data):
+        assert_conforms(path, html, chunks)
+
+
+@pytest.mark.parametrize("path", CODE_PATHS, ids=lambda p: p.name)
+def test_code_path_matches_reference_with_single_byte_chunks(path: CodePath):
+    """A body streamed one byte at a time is injected like the whole document."""
+    html = "<html><body>İ🙂日本</BODY></body></html>"
+    data = html.encode("utf-8")
+    assert_conforms(path, html, [data[i : i + 1] for i in range(len(data))])
+
+
+def test_reference_injects_before_first_body_close():
+    """The reference splices before the first </body>, ignoring case."""
+    html = "<p>İ</BODY>x</body>"
+    result = inject_agentation(html, CONFIG)
+    assert result.startswith("<p>İ<script>")
+    assert result.endswith("</script>\n</BODY>x</body>")
+
+
+def test_generator_is_deterministic():
+    """The same seed always yields the same documents."""
+    assert generate_documents(seed=1, count=5) == generate_documents(seed=1, count=5)
@@ -0,0 +1,145 @@
+"""Tests for Content-Security-Policy support."""
+
+from agentation.assets import get_script_hash, get_style_hashes
+from agentation.config import AgentationConfig
+from agentation.csp import _amend_template, amend_policy, get_csp_sources, get_csp_style_sources
+
+ORIGIN = "https://example.com"
+ASSETS = "https://example.com/__agentation__/"
+HASH = f"'{get_script_hash()}'"
+STYLES = get_csp_style_sources()
+
+
+def test_sources_inline_script_hash():
+    assert get_csp_sources(AgentationConfig(csp=True), ORIGIN, None) == (HASH, ASSETS)
+
+
+def test_sources_include_base_path():
+    config = AgentationConfig(csp=True)
+    assert get_csp_sources(config, ORIGIN, None, "/admin") == (
+        HASH,
+        "https://example.com/admin/__agentation__/",
+    )
+
+
+def test_sources_use_nonce_instead_of_hash():
+    assert get_csp_sources(AgentationConfig(csp=True), ORIGIN, "abc") == ("'nonce-abc'", ASSETS)
+
+
+def test_sources_hash_inlined_bootstrap_when_preloaded():
+    """Without a nonce the bootstrap is inlined, so preload mode needs the hash too."""
+    config = AgentationConfig(csp=True, preload=True)
+    assert get_csp_sources(config, ORIGIN, None) == (HASH, ASSETS)
+
+
+def test_style_sources_hash_toolbar_stylesheets():
+    assert STYLES == tuple(f"'{style_hash}'" for style_hash in get_style_hashes())
+    assert len(STYLES) == 2
+
+
+def test_amend_strict_dynamic_policy():
+    """Host sources are ignored under 'strict-dynamic'; the hash still allows the script."""
+    policy = "script-src 'strict-dynamic' 'sha256-abc'"
+    sources = get_csp_sources(AgentationConfig(csp=True, preload=True), ORIGIN, None)
+    assert amend_policy(policy, sources) == f"{policy} {HASH} {ASSETS}"
+
+
+def test_amend_script_src():
+    policy = "default-src 'self'; script-src 'self' https://cdn.example.com"
+    assert amend_policy(policy, (HASH, ASSETS)) == (
+        f"default-src 'self'; script-src 'self' https://cdn.example.com {HASH} {ASSETS}"
+    )
+
+
+def test_amend_script_src_elem_and_script_src():
+    policy = "script-src 'self'; script-src-elem 'self'"
+    assert amend_policy(policy, (ASSETS,)) == (
+        f"script-src 'self' {ASSETS}; script-src-elem 'self' {ASSETS}"
+    )
+
+
+def test_amend_copies_default_src():
+    """Without a script directive, scripts follow default-src, which is copied."""
+    policy = "default-src 'self'; img-src *"
+    assert amend_policy(policy, (ASSETS,)) == (
+        f"default-src 'self'; img-src *; script-src 'self' {ASSETS}"
+    )
+
+
+def test_amend_leaves_unrestricted_policy():
+    policy = "frame-ancestors 'none'"
+    assert amend_policy(policy, (HASH, ASSETS)) == policy
+
+
+def test_amend_replaces_none():
+    assert amend_policy("script-src 'none'", (ASSETS,)) == f"script-src {ASSETS}"
+
+
+def test_amend_keeps_unsafe_inline_working():
+    """A hash would disable 'unsafe-inline' for the page's own scripts."""
+    policy = "script-src 'self' 'unsafe-inline'"
+    assert amend_policy(policy, (HASH, ASSETS)) == f"script-src 'self' 'unsafe-inline' {ASSETS}"
+
+    policy = "script-src 'unsafe-inline' 'nonce-abc'"
+    assert amend_policy(policy, (HASH,)) == f"script-src 'unsafe-inline' 'nonce-abc' {HASH}"
+
+    policy = "script-src 'unsafe-inline'"
+    assert amend_policy(policy, ("'nonce-abc'",)) == policy
+
+
+def test_amend_is_idempotent():
+    policy = amend_policy("script-src 'self'", (HASH, ASSETS))
+    assert amend_policy(policy, (HASH, ASSETS)) == policy
+
+
+def test_amend_keeps_nonces():
+    policy = "default-src 'nonce-abc'; script-src 'self' 'nonce-abc'"
+    assert amend_policy(policy, (ASSETS,)) == (
+        f"default-src 'nonce-abc'; script-src 'self' 'nonce-abc' {ASSETS}"
+    )
+    # A copy of default-src keeps its nonce
+    assert amend_policy("default-src 'nonce-x1' 'nonce-y2'", (ASSETS,)) == (
+        f"default-src 'nonce-x1' 'nonce-y2'; script-src 'nonce-x1' 'nonce-y2' {ASSETS}"
+    )
+
+
+def test_amend_parses_nonce_policies_once():
+    """Policies that only differ by their per-request nonce share a cache entry."""
+    _amend_template.cache_clear()
+    for nonce in ("r4nd0m", "0th3r", "th1rd"):
+        policy = f"script-src 'self' 'nonce-{nonce}'"
+        assert amend_policy(policy, (ASSETS,)) == f"{policy} {ASSETS}"
+    info = _amend_template.cache_info()
+    assert (info.misses, info.hits) == (1, 2)
+
+
+def test_amend_adds_missing_nonce():
+    """A nonce the policy does not allow for scripts yet is added."""
+    assert amend_policy("script-src 'self'", ("'nonce-abc'", ASSETS)) == (
+        f"script-src 'self' 'nonce-abc' {ASSETS}"
+    )
+    assert amend_policy("script-src 'nonce-abc'", ("'nonce-abc'",)) == "script-src 'nonce-abc'"
+
+
+def test_amend_default_src_policy_allows_styles():
+    """A Talisman-style default-src policy gets style-src as well as script-src."""
+    policy = "default-src 'self'"
+    assert amend_policy(policy, (HASH, ASSETS), STYLES) == (
+        f"default-src 'self'; script-src 'self' {HASH} {ASSETS}; "
+        f"style-src 'self' {' '.join(STYLES)}"
+    )
+
+
+def test_amend_style_directives():
+    policy = "script-src 'self'; style-src-elem 'self'; style-src 'none'"
+    assert amend_policy(policy, (ASSETS,), STYLES) == (
+        f"script-src 'self' {ASSETS}; style-src-elem 'self' {' '.join(STYLES)}; "
+        f"style-src {' '.join(STYLES)}"
+    )
+    # 'unsafe-inline' already allows the styles, and a hash would switch it off
+    policy = "script-src 'self'; style-src 'self' 'unsafe-inline'"
+    assert amend_policy(policy, (ASSETS,), STYLES) == (
+        f"script-src 'self' {ASSETS}; style-src 'self' 'unsafe-inline'"
+    )
+    # Without default-src or a style directive, styles are not restricted
+    assert amend_policy("script-src 'self'", (ASSETS,), STYLES) == f"script-src 'self' {ASSETS}"
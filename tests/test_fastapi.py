@@ -1,12 +1,28 @@
 """Tests for FastAPI/Starlette middleware."""
 
+import os
+
+from conftest import run_asgi
 from starlette.applications import Starlette
-from starlette.responses import HTMLResponse, JSONResponse
-from starlette.routing import Route
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.responses import FileResponse, HTMLResponse, JSONResponse
+from starlette.routing import Mount, Route
+from starlette.staticfiles import StaticFiles
 from starlette.testclient import TestClient
 
 from agentation import AgentationConfig
-from agentation.adapters.fastapi import AgentationMiddleware
+from agentation.adapters.fastapi import AgentationMiddleware, _FileSpliceResponse
+from agentation.assets import (
+    get_asset_content,
+    get_bundle_path,
+    get_chunk_urls,
+    get_js_content,
+    get_preload_link,
+    get_script_hash,
+)
+from agentation.csp import get_csp_style_sources
+
+STYLE_SOURCES = " ".join(get_csp_style_sources())
 
 
 def create_app(config=None, debug=False):
@@ -69,3 +85,275 @@ def test_middleware_default_config():
     client = TestClient(app)
     response = client.get("/")
     assert "__AGENTATION_CONFIG__" not in response.text
+
+
+def test_middleware_preserves_headers_and_updates_content_length():
+    async def homepage(request):
+        response = HTMLResponse("<html><body><h1>Hello</h1></body></html>")
+        response.set_cookie("a", "1")
+        response.set_cookie("b", "2")
+        return response
+
+    app = Starlette(routes=[Route("/", homepage)])
+    app.add_middleware(AgentationMiddleware, config=AgentationConfig(enabled=True))
+    client = TestClient(app)
+    response = client.get("/")
+    assert len(response.headers.get_list("set-cookie")) == 2
+    assert int(response.headers["content-length"]) == len(response.content)
+
+
+def test_middleware_preload_adds_link_header():
+    config = AgentationConfig(enabled=True, preload=True)
+    app = create_app(config=config)
+    client = TestClient(app)
+    response = client.get("/")
+    assert response.headers["link"] == get_preload_link()
+    assert f'<script src="{get_bundle_path()}"></script>' in response.text
+
+
+def create_csp_app(nonce=None):
+    async def homepage(request):
+        if nonce:
+            request.state.csp_nonce = nonce
+        response = HTMLResponse(
+            "<html><body><h1>Hello</h1></body></html>",
+            headers={"Content-Security-Policy": "default-src 'self'; script-src 'self'"},
+        )
+        response.set_cookie("a", "1")
+        return response
+
+    app = Starlette(routes=[Route("/", homepage)])
+    app.add_middleware(AgentationMiddleware, config=AgentationConfig(enabled=True, csp=True))
+    return app
+
+
+def test_middleware_csp_amends_policy_with_script_hash():
+    client = TestClient(create_csp_app())
+    response = client.get("/")
+    assert response.headers["content-security-policy"] == (
+        f"default-src 'self'; script-src 'self' '{get_script_hash()}' "
+        f"http://testserver/__agentation__/; style-src 'self' {STYLE_SOURCES}"
+    )
+    assert response.headers["set-cookie"].startswith("a=1")
+    assert '<script type="application/json" id="agentation-config">' in response.text
+
+
+def test_middleware_csp_reuses_request_nonce():
+    client = TestClient(create_csp_app(nonce="r4nd0m"))
+    response = client.get("/")
+    assert response.headers["content-security-policy"] == (
+        "default-src 'self'; script-src 'self' 'nonce-r4nd0m' http://testserver/__agentation__/; "
+        f"style-src 'self' {STYLE_SOURCES}"
+    )
+    assert '<script nonce="r4nd0m">' in response.text
+
+
+def test_middleware_no_preload_or_csp_without_injection():
+    async def fragment(request):
+        return HTMLResponse(
+            "<h1>Fragment</h1>", headers={"Content-Security-Policy": "script-src 'self'"}
+        )
+
+    config = AgentationConfig(enabled=True, preload=True, csp=True)
+    app = Starlette(routes=[Route("/", fragment)])
+    app.add_middleware(AgentationMiddleware, config=config)
+    response = TestClient(app).get("/")
+    assert response.text == "<h1>Fragment</h1>"
+    assert "link" not in response.headers
+    assert response.headers["content-security-policy"] == "script-src 'self'"
+
+
+def test_middleware_preload_serves_bundle():
+    config = AgentationConfig(enabled=True, preload=True)
+    app = create_app(config=config)
+    client = TestClient(app)
+    response = client.get(get_bundle_path())
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/javascript")
+    assert "immutable" in response.headers["cache-control"]
+    assert response.text == get_js_content()
+
+
+def test_middleware_serves_chunks():
+    config = AgentationConfig(enabled=True)
+    app = create_app(config=config)
+    client = TestClient(app)
+    toolbar_url = get_chunk_urls()["toolbar"]
+    response = client.get(toolbar_url)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/javascript")
+    assert "immutable" in response.headers["cache-control"]
+    assert response.text == get_asset_content(toolbar_url)
+
+
+def test_middleware_asset_urls_follow_mount_path():
+    sub_app = create_app(config=AgentationConfig(enabled=True, preload=True))
+    app = Starlette(routes=[Mount("/admin", sub_app)])
+    client = TestClient(app)
+
+    response = client.get("/admin/")
+    toolbar_url = get_chunk_urls("/admin")["toolbar"]
+    assert toolbar_url in response.text
+    assert f'<script src="{get_bundle_path("/admin")}"></script>' in response.text
+    assert response.headers["link"] == get_preload_link("/admin")
+    assert client.get(toolbar_url).status_code == 200
+    assert client.get(get_bundle_path("/admin")).status_code == 200
+
+
+def test_middleware_asset_urls_follow_proxy_root_path():
+    app = create_app(config=AgentationConfig(enabled=True))
+    client = TestClient(app, root_path="/proxy")
+    response = client.get("/")
+    assert get_chunk_urls("/proxy")["toolbar"] in response.text
+
+
+def test_middleware_unknown_asset_not_found():
+    config = AgentationConfig(enabled=True)
+    app = create_app(config=config)
+    client = TestClient(app)
+    response = client.get("/__agentation__/chunks/missing.js")
+    assert response.status_code == 404
+
+
+def test_middleware_assets_not_served_when_disabled():
+    config = AgentationConfig(enabled=False)
+    app = create_app(config=config)
+    client = TestClient(app)
+    response = client.get(get_chunk_urls()["toolbar"])
+    assert response.status_code == 404
+
+
+def create_preload_app(sent, seen_by_handler):
+    async def homepage(request):
+        # Snapshot what the server had sent by the time the handler ran
+        seen_by_handler.extend(message["type"] for message in sent)
+        return HTMLResponse("<html><body><h1>Hello</h1></body></html>")
+
+    app = Starlette(routes=[Route("/", homepage)])
+    app.add_middleware(AgentationMiddleware, config=AgentationConfig(enabled=True, preload=True))
+    return app
+
+
+def test_middleware_sends_early_hint_before_handler():
+    sent, seen_by_handler = [], []
+    app = create_preload_app(sent, seen_by_handler)
+    run_asgi(app, {"http.response.early_hint": {}}, sent)
+
+    assert seen_by_handler == ["http.response.early_hint"]
+    assert sent[0] == {
+        "type": "http.response.early_hint",
+        "links": [get_preload_link().encode("latin-1")],
+    }
+    assert sent[1]["type"] == "http.response.start"
+    assert (b"link", get_preload_link().encode("latin-1")) in sent[1]["headers"]
+
+
+def test_middleware_skips_early_hint_without_server_support():
+    sent, seen_by_handler = [], []
+    app = create_preload_app(sent, seen_by_handler)
+    run_asgi(app, {}, sent)
+
+    assert seen_by_handler == []
+    assert sent[0]["type"] == "http.response.start"
+    assert (b"link", get_preload_link().encode("latin-1")) in sent[0]["headers"]
+
+
+def test_middleware_skips_early_hint_for_non_navigation():
+    sent, seen_by_handler = [], []
+    app = create_preload_app(sent, seen_by_handler)
+    run_asgi(app, {"http.response.early_hint": {}}, sent, accept=b"application/json")
+
+    assert seen_by_handler == []
+    assert sent[0]["type"] == "http.response.start"
+
+
+def create_file_app(tmp_path, config=None):
+    page = tmp_path / "page.html"
+    page.write_text("<html><body><h1>Static</h1></body></html>")
+    data = tmp_path / "data.txt"
+    data.write_text("plain </body> text")
+
+    async def html_file(request):
+        return FileResponse(page)
+
+    async def text_file(request):
+        return FileResponse(data)
+
+    app = Starlette(routes=[Route("/page", html_file), Route("/data", text_file)])
+    app.add_middleware(AgentationMiddleware, config=config or AgentationConfig(enabled=True))
+    return app
+
+
+def test_middleware_injects_into_file_response(tmp_path):
+    client = TestClient(create_file_app(tmp_path))
+    response = client.get("/page")
+    assert "__AGENTATION_CONFIG__" in response.text
+    assert response.text.endswith("</body></html>")
+    assert int(response.headers["content-length"]) == len(response.content)
+
+
+def test_middleware_head_content_length(tmp_path):
+    client = TestClient(create_file_app(tmp_path))
+    # FileResponse sends no body for HEAD, so the injected length is unknown and the
+    # file's own length would not describe the GET body
+    response = client.head("/page")
+    assert "content-length" not in response.headers
+
+    # HTMLResponse bodies are sent regardless, so HEAD matches GET
+    client = TestClient(create_app(config=AgentationConfig(enabled=True)))
+    head, get = client.head("/"), client.get("/")
+    assert head.headers["content-length"] == get.headers["content-length"]
+
+
+def test_middleware_streams_non_html_file_response(tmp_path):
+    client = TestClient(create_file_app(tmp_path))
+    response = client.get("/data")
+    assert response.text == "plain </body> text"
+
+
+def test_middleware_keeps_inner_middleware_body_handling(tmp_path):
+    # Without server support for pathsend, inner middleware such as GZip must still
+    # see the file body rather than a pathsend message it cannot compress
+    (tmp_path / "style.css").write_text("body { color: red; }\n" * 150)
+    app = Starlette(routes=[Mount("/static", StaticFiles(directory=tmp_path))])
+    app.add_middleware(GZipMiddleware)
+    app.add_middleware(AgentationMiddleware, config=AgentationConfig(enabled=True))
+
+    response = TestClient(app).get("/static/style.css")
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.text == "body { color: red; }\n" * 150
+
+
+def test_middleware_file_response_uses_zerocopy(tmp_path):
+    sent = []
+    extensions = {"http.response.pathsend": {}, "http.response.zerocopysend": {}}
+    run_asgi(create_file_app(tmp_path), extensions, sent, path="/page")
+
+    size = os.path.getsize(tmp_path / "page.html")
+    offset = len("<html><body><h1>Static</h1>")
+    ranges = [
+        (m["offset"], m["count"]) for m in sent if m["type"] == "http.response.zerocopysend"
+    ]
+    bodies = [m["body"] for m in sent if m["type"] == "http.response.body"]
+    assert ranges == [(0, offset), (offset, size - offset)]
+    # Only the injected payload passes through Python
+    assert len(bodies) == 1
+    assert b"__AGENTATION_CONFIG__" in bodies[0]
+
+
+def test_file_splice_response_is_a_complete_response(tmp_path):
+    # Code wrapping the middleware may inspect the returned response like any other
+    headers = [(b"content-type", b"text/html")]
+    response = _FileSpliceResponse(str(tmp_path / "page.html"), 0, 0, b"", 200, headers)
+    assert response.body == b""
+    assert response.headers["content-type"] == "text/html"
+    assert response.background is None
+
+
+def test_middleware_passes_pathsend_through_for_non_html(tmp_path):
+    sent = []
+    run_asgi(create_file_app(tmp_path), {"http.response.pathsend": {}}, sent, path="/data")
+    assert sent[-1] == {
+        "type": "http.response.pathsend",
+        "path": str(tmp_path / "data.txt"),
+    }
@@ -1,10 +1,19 @@
 """Tests for Flask extension."""
 
 import pytest
-from flask import Flask
+from flask import Flask, request, send_file
 
 from agentation import AgentationConfig
 from agentation.adapters.flask import AgentationFlask
+from agentation.assets import (
+    get_asset_content,
+    get_bundle_path,
+    get_chunk_urls,
+    get_js_content,
+    get_preload_link,
+    get_script_hash,
+)
+from agentation.csp import get_csp_style_sources
 
 
 @pytest.fixture
@@ -106,3 +115,227 @@ def test_flask_init_app_pattern():
     html = response.get_data(as_text=True)
 
     assert "__AGENTATION_CONFIG__" in html
+
+
+def test_flask_preload_adds_link_header(app):
+    """Preload mode references the served bundle and advertises it."""
+    AgentationFlask(app, config=AgentationConfig(preload=True))
+    client = app.test_client()
+
+    response = client.get("/")
+    html = response.get_data(as_text=True)
+
+    assert response.headers["Link"] == get_preload_link()
+    assert f'<script src="{get_bundle_path()}"></script>' in html
+
+
+def test_flask_csp_amends_policy(app):
+    """CSP mode allows the inline script by hash in the app's policy."""
+
+    # Registered first, like Talisman(app) before AgentationFlask(app), so this hook
+    # runs after Agentation's
+    @app.after_request
+    def add_policy(response):
+        response.headers["Content-Security-Policy"] = "script-src 'self'"
+        return response
+
+    AgentationFlask(app, config=AgentationConfig(csp=True))
+    response = app.test_client().get("/")
+
+    assert response.headers["Content-Security-Policy"] == (
+        f"script-src 'self' '{get_script_hash()}' http://localhost/__agentation__/"
+    )
+
+
+def test_flask_csp_allows_styles_under_default_src(app):
+    """Talisman's default policy also covers the toolbar's <style> elements."""
+    AgentationFlask(app, config=AgentationConfig(csp=True))
+
+    @app.after_request
+    def add_policy(response):
+        response.headers["Content-Security-Policy"] = "default-src 'self'"
+        return response
+
+    response = app.test_client().get("/")
+
+    assert response.headers["Content-Security-Policy"] == (
+        f"default-src 'self'; script-src 'self' '{get_script_hash()}' "
+        "http://localhost/__agentation__/; "
+        f"style-src 'self' {' '.join(get_csp_style_sources())}"
+    )
+
+
+def test_flask_csp_amends_policy_set_after_extension(app):
+    """Policies set by hooks registered after the extension are amended too."""
+    AgentationFlask(app, config=AgentationConfig(csp=True))
+
+    @app.after_request
+    def add_policy(response):
+        response.headers["Content-Security-Policy"] = "script-src 'self'"
+        return response
+
+    response = app.test_client().get("/")
+
+    assert get_script_hash() in response.headers["Content-Security-Policy"]
+
+
+def test_flask_csp_leaves_non_html_policy(app):
+    """Only responses Agentation injected into have their policy amended."""
+    AgentationFlask(app, config=AgentationConfig(csp=True))
+
+    @app.after_request
+    def add_policy(response):
+        response.headers["Content-Security-Policy"] = "script-src 'self'"
+        return response
+
+    response = app.test_client().get("/json")
+
+    assert response.headers["Content-Security-Policy"] == "script-src 'self'"
+
+
+def test_flask_csp_preload_with_strict_dynamic(app):
+    """Under 'strict-dynamic' the bootstrap is inlined and allowed by hash, not by URL."""
+
+    @app.after_request
+    def add_policy(response):
+        response.headers["Content-Security-Policy"] = "script-src 'strict-dynamic' 'sha256-abc'"
+        return response
+
+    AgentationFlask(app, config=AgentationConfig(csp=True, preload=True))
+    response = app.test_client().get("/")
+    html = response.get_data(as_text=True)
+
+    assert get_bundle_path() not in html
+    assert "Link" not in response.headers
+    assert f"'{get_script_hash()}'" in response.headers["Content-Security-Policy"]
+
+
+def test_flask_csp_reuses_request_nonce(app):
+    """A nonce set on the request (as Flask-Talisman does) is used instead of the hash."""
+    AgentationFlask(app, config=AgentationConfig(csp=True))
+
+    @app.before_request
+    def set_nonce():
+        request.csp_nonce = "r4nd0m"
+
+    @app.after_request
+    def add_policy(response):
+        response.headers["Content-Security-Policy"] = "script-src 'nonce-r4nd0m'"
+        return response
+
+    response = app.test_client().get("/")
+    html = response.get_data(as_text=True)
+
+    assert '<script nonce="r4nd0m">' in html
+    assert response.headers["Content-Security-Policy"] == (
+        "script-src 'nonce-r4nd0m' http://localhost/__agentation__/"
+    )
+
+
+def test_flask_no_preload_or_csp_without_injection(app):
+    """Fragments without </body> get neither the Link header nor an amended policy."""
+
+    @app.route("/fragment")
+    def fragment():
+        return "<h1>Fragment</h1>", {"Content-Security-Policy": "script-src 'self'"}
+
+    AgentationFlask(app, config=AgentationConfig(preload=True, csp=True))
+    response = app.test_client().get("/fragment")
+
+    assert "Link" not in response.headers
+    assert response.headers["Content-Security-Policy"] == "script-src 'self'"
+
+
+def test_flask_preload_serves_bundle(app):
+    """The bundle is served with immutable caching in preload mode."""
+    AgentationFlask(app, config=AgentationConfig(preload=True))
+    client = app.test_client()
+
+    response = client.get(get_bundle_path())
+
+    assert response.status_code == 200
+    assert response.mimetype == "text/javascript"
+    assert "immutable" in response.headers["Cache-Control"]
+    assert response.get_data(as_text=True) == get_js_content()
+
+
+def test_flask_serves_chunks(app):
+    """Toolbar chunks are served on demand with immutable caching."""
+    AgentationFlask(app)
+    client = app.test_client()
+    toolbar_url = get_chunk_urls()["toolbar"]
+
+    response = client.get(toolbar_url)
+
+    assert response.status_code == 200
+    assert response.mimetype == "text/javascript"
+    assert "immutable" in response.headers["Cache-Control"]
+    assert response.get_data(as_text=True) == get_asset_content(toolbar_url)
+
+
+def test_flask_asset_urls_follow_script_root(app):
+    """Under a SCRIPT_NAME prefix, injected asset URLs include it."""
+    AgentationFlask(app, config=AgentationConfig(preload=True))
+    client = app.test_client()
+
+    response = client.get("/", base_url="http://localhost/prefix")
+    html = response.get_data(as_text=True)
+    toolbar_url = get_chunk_urls("/prefix")["toolbar"]
+
+    assert toolbar_url in html
+    assert response.headers["Link"] == get_preload_link("/prefix")
+    chunk = client.get(toolbar_url.removeprefix("/prefix"), base_url="http://localhost/prefix")
+    assert chunk.status_code == 200
+
+
+def test_flask_unknown_asset_not_found(app):
+    """Paths outside the chunk manifest are not served."""
+    AgentationFlask(app)
+    client = app.test_client()
+
+    response = client.get("/__agentation__/chunks/missing.js")
+
+    assert response.status_code == 404
+
+
+def create_file_app(tmp_path, html):
+    """Create a Flask app serving ``html`` from disk with send_file."""
+    page = tmp_path / "page.html"
+    page.write_text(html)
+
+    app = Flask(__name__)
+    app.debug = True
+
+    @app.route("/page")
+    def page_route():
+        return send_file(page)
+
+    AgentationFlask(app)
+    return app
+
+
+def test_flask_injects_into_send_file(tmp_path):
+    """HTML served with send_file is injected while streaming from disk."""
+    app = create_file_app(tmp_path, "<html><body><h1>Static</h1></body></html>")
+    client = app.test_client()
+
+    response = client.get("/page")
+    html = response.get_data(as_text=True)
+    response.close()
+
+    assert "__AGENTATION_CONFIG__" in html
+    assert html.startswith("<html><body><h1>Static</h1><script>")
+    assert html.endswith("</body></html>")
+    assert response.content_length == len(response.get_data())
+
+
+def test_flask_send_file_without_body_unchanged(tmp_path):
+    """A file without </body> is served as is."""
+    app = create_file_app(tmp_path, "<html><h1>Static</h1></html>")
+    client = app.test_client()
+
+    response = client.get("/page")
+    html = response.get_data(as_text=True)
+    response.close()
+
+    assert html == "<html><h1>Static</h1></html>"
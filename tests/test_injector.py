@@ -1,7 +1,13 @@
 """Tests for HTML injection."""
 
+import base64
+import hashlib
+import os
+import re
+
+from agentation.assets import get_bundle_path, get_chunk_urls, get_js_content, get_script_hash
 from agentation.config import AgentationConfig
-from agentation.injector import inject_agentation
+from agentation.injector import find_body_close_in_file, inject_agentation
 
 
 def test_inject_adds_script_before_body():
@@ -85,3 +91,122 @@ def test_inject_case_insensitive_body_tag():
     result = inject_agentation(html, config)
 
     assert "__AGENTATION_CONFIG__" in result
+
+
+def test_inject_preload_references_bundle():
+    """Preload mode loads the bundle by URL instead of inlining it."""
+    html = "<html><body></body></html>"
+    config = AgentationConfig(preload=True)
+    result = inject_agentation(html, config)
+
+    assert "__AGENTATION_CONFIG__" in result
+    assert f'<script src="{get_bundle_path()}"></script>' in result
+    assert get_js_content() not in result
+
+
+def test_inject_prefixes_asset_urls_with_base_path():
+    """Apps mounted below the site root get asset URLs under their mount point."""
+    html = "<html><body></body></html>"
+    config = AgentationConfig(preload=True)
+    result = inject_agentation(html, config, base_path="/admin")
+
+    assert f'<script src="/admin{get_bundle_path()}"></script>' in result
+    assert f'"toolbar":"/admin{get_chunk_urls()["toolbar"]}"' in result
+
+
+def test_inject_includes_chunk_urls():
+    """The bootstrap is told where to load the toolbar from."""
+    html = "<html><body></body></html>"
+    config = AgentationConfig()
+    result = inject_agentation(html, config)
+
+    assert f'"chunks":{{"toolbar":"{get_chunk_urls()["toolbar"]}"}}' in result
+
+
+def test_inject_csp_uses_data_block_and_hashable_script():
+    """CSP mode keeps the config out of the executable script."""
+    html = "<html><body></body></html>"
+    config = AgentationConfig(csp=True)
+    result = inject_agentation(html, config, route="/a")
+
+    assert "window.__AGENTATION_CONFIG__ =" not in result
+    assert '<script type="application/json" id="agentation-config">' in result
+    script = re.search(r"<script>(.*?)</script>", result, re.S).group(1)
+    digest = base64.b64encode(hashlib.sha384(script.encode("utf-8")).digest()).decode()
+    assert get_script_hash() == f"sha384-{digest}"
+    # The script is the same on every route, so a single hash covers them all
+    assert script in inject_agentation(html, config, route="/b")
+
+
+def test_inject_csp_escapes_config():
+    """Config values cannot end the data block early."""
+    html = "<html><body></body></html>"
+    config = AgentationConfig(csp=True, theme="</script><!--")
+    result = inject_agentation(html, config)
+
+    assert "\\u003c\\/script>\\u003c!--" in result
+    assert result.count("</script>") == 2
+
+
+def test_inject_csp_nonce():
+    """A request nonce is added to the script tag, escaped."""
+    html = "<html><body></body></html>"
+    result = inject_agentation(html, AgentationConfig(csp=True), nonce='a"b')
+    assert '<script nonce="a&quot;b">' in result
+
+    preload = AgentationConfig(csp=True, preload=True)
+    result = inject_agentation(html, preload, nonce="abc")
+    assert f'<script src="{get_bundle_path()}" nonce="abc"></script>' in result
+
+
+def test_inject_csp_preload_without_nonce_inlines_bootstrap():
+    """Without a nonce, only an inline script can be allowed under 'strict-dynamic'."""
+    html = "<html><body></body></html>"
+    result = inject_agentation(html, AgentationConfig(csp=True, preload=True))
+
+    assert get_bundle_path() not in result
+    assert f"<script>{get_js_content()}</script>" in result
+
+
+def test_inject_nonce_ignored_without_csp():
+    html = "<html><body></body></html>"
+    result = inject_agentation(html, AgentationConfig(), nonce="abc")
+    assert "nonce" not in result
+
+
+def find_in(path):
+    stat_result = os.stat(path)
+    return find_body_close_in_file(str(path), stat_result.st_mtime_ns, stat_result.st_size)
+
+
+def test_find_body_close_in_file_matches_inject(tmp_path):
+    """The file offset is where inject_agentation splices, in bytes."""
+    html = "<p>İ🙂</BODY>x</body>"
+    path = tmp_path / "page.html"
+    path.write_text(html, encoding="utf-8")
+
+    offset = find_in(path)
+    result = inject_agentation(html, AgentationConfig()).encode("utf-8")
+
+    assert offset == len("<p>İ🙂".encode())
+    assert result.startswith(html.encode("utf-8")[:offset] + b"<script>")
+
+
+def test_find_body_close_in_file_missing(tmp_path):
+    """Files without </body>, including empty ones, have no offset."""
+    path = tmp_path / "page.html"
+    path.write_text("<html></html>")
+    assert find_in(path) is None
+
+    path.write_text("")
+    assert find_in(path) is None
+
+
+def test_find_body_close_in_file_rescans_changed_file(tmp_path):
+    """A new size or mtime is a new cache key."""
+    path = tmp_path / "page.html"
+    path.write_text("<body></body>")
+    assert find_in(path) == 6
+
+    path.write_text("<body>changed</body>")
+    assert find_in(path) == 13